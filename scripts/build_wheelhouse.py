@@ -6,17 +6,445 @@ Usage:
 
 This downloads SudaPy and all its dependencies (including optional extras)
 as wheel files into the specified directory.
+
+Dependencies are resolved once with ``pip install --dry-run --report`` and
+the resulting files are then fetched concurrently. If the installed pip is
+too old to produce a report, the script falls back to ``pip download``.
 """
 
 from __future__ import annotations
 
-import argparse
+import base64
+import contextlib
+import hashlib
+import http.client
+import importlib.util
+import json
+import os
+import platform
+import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import unquote, urljoin, urlsplit
+
+# __file__ is already absolute (Python 3.9+), so no realpath() is needed.
+_PROJECT_ROOT = Path(__file__).parent.parent
+
+_print_lock = threading.Lock()
+
+# Resolved install plans are reused for this long before pip re-resolves.
+_PLAN_TTL_SECONDS = 24 * 60 * 60
+
+
+def _pip_supports(command: str, option: str) -> bool:
+    """Return ``True`` if ``pip <command>`` accepts *option*."""
+    try:
+        help_text = subprocess.check_output(
+            [sys.executable, "-m", "pip", command, "--help"],
+            text=True,
+            stderr=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return option in help_text
+
+
+def _run_stage(label: str, cmd: list[str]) -> None:
+    """Run *cmd*, echo its output prefixed with *label*, and raise on failure."""
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    with _print_lock:
+        for line in (proc.stdout + proc.stderr).splitlines():
+            print(f"[{label}] {line}")
+    proc.check_returncode()
+
+
+def _pip(args: list[str]) -> None:
+    """Run pip with *args*, in this process when possible.
+
+    Calling pip's entry point directly saves starting another interpreter
+    and re-importing pip. That entry point isn't a supported API, so fall
+    back to a subprocess if it can't be imported. pip keeps global state,
+    so this is only used for steps that never run concurrently with
+    another in-process pip call.
+    """
+    try:
+        from pip._internal.cli.main import main as pip_main
+    except ImportError:
+        subprocess.run([sys.executable, "-m", "pip", *args], check=True)
+        return
+    rc = pip_main(args)
+    if rc:
+        raise subprocess.CalledProcessError(rc, ["pip", *args])
+
+
+def _resolve_plan(install_spec: str, pip_opts: list[str]) -> list[dict]:
+    """Resolve *install_spec* without installing and return pip's install plan."""
+    with tempfile.TemporaryDirectory() as tmp:
+        report = Path(tmp) / "report.json"
+        _pip([
+            "install", install_spec,
+            "--dry-run", "--ignore-installed", "--quiet", "--report", str(report), *pip_opts,
+        ])
+        return json.loads(report.read_text(encoding="utf-8"))["install"]
+
+
+def _plan_key(project_root: Path, extras: str) -> str:
+    """Hash everything that can change the resolved plan."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update((project_root / "pyproject.toml").read_bytes())
+    h.update(extras.encode())
+    h.update(sys.version.encode())
+    h.update(platform.platform().encode())
+    return h.hexdigest()
+
+
+def _load_plan(
+    install_spec: str,
+    pip_opts: list[str],
+    cache_file: Path,
+    refresh: bool = False,
+) -> list[dict]:
+    """Return the cached install plan if it is fresh, else resolve and cache it.
+
+    A cache file that cannot be read or doesn't look like a plan is deleted
+    and the plan re-resolved, so a bad cache never forces the slow
+    ``pip download`` fallback.
+    """
+    if not refresh and cache_file.exists():
+        age = time.time() - cache_file.stat().st_mtime
+        if age < _PLAN_TTL_SECONDS:
+            try:
+                plan = json.loads(cache_file.read_text(encoding="utf-8"))
+                if not _is_plan(plan):
+                    raise ValueError("not an install plan")
+            except (OSError, ValueError):
+                with _print_lock:
+                    print(f"[download] Ignoring corrupt plan cache {cache_file.name}; re-resolving")
+                cache_file.unlink(missing_ok=True)
+            else:
+                with _print_lock:
+                    print(f"[download] Reusing resolved plan {cache_file.name}")
+                return plan
+
+    plan = _resolve_plan(install_spec, pip_opts)
+    # Write to a temporary name first so an interrupted run can't leave a
+    # truncated plan behind.
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    part = cache_file.with_name(cache_file.name + ".part")
+    part.write_text(json.dumps(plan), encoding="utf-8")
+    os.replace(part, cache_file)
+    return plan
+
+
+def _is_plan(plan: object) -> bool:
+    """Return ``True`` if *plan* has the shape :func:`_plan_files` reads."""
+    return isinstance(plan, list) and all(
+        isinstance(item, dict)
+        and isinstance(item.get("download_info"), dict)
+        and isinstance(item["download_info"].get("url"), str)
+        for item in plan
+    )
+
+
+def _plan_cache_dir(cache_dir: Path | None) -> Path:
+    """Return where resolved plans are kept, outside the shipped wheelhouse.
+
+    Plans go next to pip's cache when ``--cache-dir`` is given, otherwise
+    into the user cache directory (``$XDG_CACHE_HOME``, ``%LOCALAPPDATA%``
+    on Windows).
+    """
+    if cache_dir is not None:
+        return cache_dir / "sudapy-plans"
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        base = Path(os.environ["LOCALAPPDATA"])
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / "sudapy" / "wheelhouse-plans"
+
+
+def _plan_files(plan: list[dict], out_dir: Path) -> list[tuple[str, Path, str | None]]:
+    """Return ``(url, destination, sha256)`` for every remote file in *plan*."""
+    files = []
+    for item in plan:
+        info = item["download_info"]
+        url = info["url"]
+        # The project itself resolves to a local directory; it is built by
+        # the wheel stage instead.
+        if not url.startswith(("http://", "https://")):
+            continue
+        hashes = info.get("archive_info", {}).get("hashes", {})
+        name = unquote(urlsplit(url).path.rsplit("/", 1)[-1])
+        files.append((url, out_dir / name, hashes.get("sha256")))
+    return files
+
+
+_CHUNK = 1 << 20
+_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    view = memoryview(bytearray(_CHUNK))
+    with open(path, "rb") as f:
+        while n := f.readinto(view):
+            h.update(view[:n])
+    return h.hexdigest()
+
+
+# Keep-alive connections, one set per download thread.
+_local = threading.local()
+
+
+def _connection(scheme: str, host: str) -> http.client.HTTPConnection:
+    conns = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    conn = conns.get((scheme, host))
+    if conn is None:
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = conns[(scheme, host)] = cls(host, timeout=60)
+    return conn
+
+
+def _drop_connection(scheme: str, host: str) -> None:
+    conn = _local.conns.pop((scheme, host), None)
+    if conn is not None:
+        conn.close()
+
+
+def _open(url: str, max_redirects: int = 5):
+    """Open *url* for streaming, reusing this thread's connection to the host.
+
+    Almost every wheel comes from the same host, so each worker pays the
+    TCP/TLS handshake once instead of once per file. Proxied environments
+    go through :mod:`urllib.request`, which knows how to talk to proxies.
+    """
+    for _ in range(max_redirects + 1):
+        parts = urlsplit(url)
+        if parts.scheme in urllib.request.getproxies():
+            return urllib.request.urlopen(url)
+
+        host = parts.hostname or ""
+        if parts.port:
+            host = f"{host}:{parts.port}"
+        headers = {"User-Agent": "sudapy-build-wheelhouse"}
+        if parts.username:
+            token = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+            headers["Authorization"] = "Basic " + base64.b64encode(token.encode()).decode()
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+
+        for attempt in (1, 2):
+            conn = _connection(parts.scheme, host)
+            try:
+                conn.request("GET", target, headers=headers)
+                resp = conn.getresponse()
+                break
+            except (http.client.HTTPException, OSError):
+                # The server may have closed an idle keep-alive connection.
+                _drop_connection(parts.scheme, host)
+                if attempt == 2:
+                    raise
+
+        if resp.status in (301, 302, 303, 307, 308):
+            location = resp.getheader("Location", "")
+            resp.read()
+            url = urljoin(url, location)
+            continue
+        if resp.status != 200:
+            resp.read()
+            raise RuntimeError(f"HTTP {resp.status} {resp.reason} for {url}")
+        return resp
+
+    raise RuntimeError(f"Too many redirects for {url}")
+
+
+class _ByteProgress:
+    """One aggregate progress bar for all concurrent downloads.
+
+    Uses :mod:`rich` when it is importable and does nothing otherwise.
+    The total grows as each response reports its ``Content-Length``.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._total = 0
+        try:
+            from rich.progress import (
+                BarColumn,
+                DownloadColumn,
+                Progress,
+                TextColumn,
+                TransferSpeedColumn,
+            )
+        except ImportError:
+            self._progress = None
+            return
+        self._progress = Progress(
+            TextColumn(r"\[download]"),
+            BarColumn(),
+            DownloadColumn(),
+            TransferSpeedColumn(),
+        )
+        self._task = self._progress.add_task("download", total=None)
+
+    def __enter__(self) -> _ByteProgress:
+        if self._progress is not None:
+            self._progress.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        if self._progress is not None:
+            self._progress.stop()
+
+    def add_total(self, nbytes: int) -> None:
+        if self._progress is None:
+            return
+        with self._lock:
+            self._total += nbytes
+            self._progress.update(self._task, total=self._total)
+
+    def advance(self, nbytes: int) -> None:
+        if self._progress is not None:
+            self._progress.update(self._task, advance=nbytes)
+
+
+def _fetch(
+    url: str,
+    dest: Path,
+    sha256: str | None,
+    progress: _ByteProgress | None = None,
+) -> Path:
+    """Download *url* to *dest*, hashing each chunk as it is written.
+
+    Hashing happens on the receive path, so there is no second pass over
+    the file. ``hashlib`` releases the GIL for large buffers, letting one
+    worker hash while the others wait on the network.
+    """
+    if dest.exists() and (sha256 is None or _sha256(dest) == sha256):
+        return dest
+
+    part = dest.with_name(dest.name + ".part")
+    h = hashlib.sha256()
+    # One reusable buffer per download: the socket reads into it, and the
+    # hash and the file both consume the same bytes without copying.
+    view = memoryview(bytearray(_CHUNK))
+    with _open(url) as resp:
+        length = int(resp.headers.get("Content-Length") or 0)
+        if progress is not None:
+            progress.add_total(length)
+
+        fd = os.open(part, _OPEN_FLAGS, 0o644)
+        # Reserve the whole file up front so concurrent writers get
+        # contiguous extents instead of interleaved fragments (Linux only;
+        # elsewhere the file simply grows as it is written).
+        if length and hasattr(os, "posix_fallocate"):
+            # Not every filesystem supports it (e.g. some NFS mounts).
+            with contextlib.suppress(OSError):
+                os.posix_fallocate(fd, 0, length)
+
+        with os.fdopen(fd, "wb") as f:
+            while n := resp.readinto(view):
+                chunk = view[:n]
+                h.update(chunk)
+                f.write(chunk)
+                if progress is not None:
+                    progress.advance(n)
+            # Drop any preallocated tail if the server sent fewer bytes.
+            f.truncate()
+
+    if sha256 is not None and h.hexdigest() != sha256:
+        part.unlink()
+        raise RuntimeError(f"SHA256 mismatch for {dest.name}")
+    os.replace(part, dest)
+    return dest
+
+
+def _download_dependencies(
+    install_spec: str,
+    out_dir: Path,
+    jobs: int,
+    pip_opts: list[str],
+    fallback: list[str],
+    plan_cache: Path,
+    refresh: bool = False,
+) -> None:
+    """Resolve once, then fetch every file with *jobs* concurrent workers."""
+    try:
+        plan = _load_plan(install_spec, pip_opts, plan_cache, refresh=refresh)
+    except (subprocess.CalledProcessError, ValueError, KeyError):
+        with _print_lock:
+            print("[download] pip cannot report an install plan; using pip download")
+        _run_stage("download", fallback)
+        return
+
+    files = _plan_files(plan, out_dir)
+    with _ByteProgress() as progress, ThreadPoolExecutor(max_workers=max(jobs, 1)) as pool:
+        futures = [pool.submit(_fetch, *f, progress) for f in files]
+        for future in futures:
+            path = future.result()
+            with _print_lock:
+                print(f"[download] {path.name}")
+
+
+def _parse_target(target: str) -> tuple[str, str]:
+    """Split ``PLATFORM-PYVERSION`` (e.g. ``win_amd64-311``) into its parts."""
+    plat, _, pyver = target.rpartition("-")
+    if not plat or not pyver.isdigit():
+        raise SystemExit(
+            f"Invalid --target {target!r}: expected PLATFORM-PYVERSION, e.g. win_amd64-311"
+        )
+    return plat, pyver
+
+
+def _download_targets(
+    requirements: list[str],
+    out_dir: Path,
+    targets: list[tuple[str, str, str]],
+    pip_opts: list[str],
+) -> None:
+    """Download binary wheels for each target into ``out_dir/<target>/``.
+
+    *requirements* are the pip arguments naming what to download.
+    *targets* holds ``(target, platform, python_version)`` triples. Each
+    target is an independent ``pip download`` process, so they all run at
+    once.
+    """
+
+    def download(target: str, plat: str, pyver: str) -> None:
+        dest = out_dir / target
+        dest.mkdir(parents=True, exist_ok=True)
+        _run_stage(
+            target,
+            [
+                sys.executable, "-m", "pip", "download", *requirements,
+                "--dest", str(dest), "--platform", plat, "--python-version", pyver,
+                "--only-binary=:all:", "--progress-bar", "off", *pip_opts,
+            ],
+        )
+
+    with ThreadPoolExecutor(max_workers=len(targets)) as pool:
+        for future in [pool.submit(download, *t) for t in targets]:
+            future.result()
+
+
+def _count_wheels(directory: Path) -> int:
+    with os.scandir(directory) as it:
+        return sum(
+            1 for e in it if e.name.endswith(".whl") and e.is_file(follow_symlinks=False)
+        )
 
 
 def main() -> None:
+    import argparse  # only the CLI needs it; keeps module import cheap
+
     parser = argparse.ArgumentParser(description="Build a SudaPy offline wheelhouse.")
     parser.add_argument(
         "--out",
@@ -29,29 +457,145 @@ def main() -> None:
         default="all",
         help='Comma-separated extras to include (default: "all")',
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=8,
+        help="Number of concurrent downloads (default: 8)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="pip cache directory to reuse across builds (default: pip's own cache)",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-resolve dependencies even if a cached install plan is fresh",
+    )
+    parser.add_argument(
+        "--target",
+        action="append",
+        default=[],
+        metavar="PLATFORM-PYVERSION",
+        help=(
+            "Build a wheelhouse for another platform, e.g. win_amd64-311 or "
+            "manylinux2014_x86_64-312. Repeat for several targets; each goes "
+            "into its own subdirectory."
+        ),
+    )
+    parser.add_argument(
+        "--lock",
+        type=Path,
+        default=None,
+        help=(
+            "Pinned requirements file with hashes (default: requirements.lock "
+            "in the project root, if present). Skips dependency resolution."
+        ),
+    )
     args = parser.parse_args()
 
+    targets = [(target, *_parse_target(target)) for target in args.target]
+
     out_dir: Path = args.out
-    out_dir.mkdir(parents=True, exist_ok=True)
+    out_dir.mkdir(mode=0o755, parents=True, exist_ok=True)
 
-    project_root = Path(__file__).resolve().parent.parent
+    project_root = _PROJECT_ROOT
     install_spec = f"{project_root}[{args.extras}]"
 
-    print(f"Downloading wheels for {install_spec} into {out_dir} ...")
+    # A hash-pinned lock file turns the download into a pure fetch loop:
+    # with --no-deps pip has nothing left to resolve.
+    lock: Path | None = args.lock
+    if lock is None and (project_root / "requirements.lock").exists():
+        lock = project_root / "requirements.lock"
+    if lock is not None and not lock.exists():
+        raise SystemExit(f"Lock file not found: {lock}")
 
-    # Step 1: Build the project wheel itself
-    subprocess.check_call(
-        [sys.executable, "-m", "pip", "wheel", str(project_root), "--wheel-dir", str(out_dir), "--no-deps"],
-    )
+    # Only used by the pip download fallback. Newer pip releases can fetch
+    # several files at once; older ones silently download serially.
+    parallel: list[str] = []
+    if args.jobs > 1 and _pip_supports("download", "--parallel-downloads"):
+        parallel = ["--parallel-downloads", str(args.jobs)]
 
-    # Step 2: Download all dependencies
-    subprocess.check_call(
-        [sys.executable, "-m", "pip", "download", install_spec, "--dest", str(out_dir)],
-    )
+    # The default download path fetches files itself (see _fetch) and never
+    # touches pip's HTTP cache; it skips files already in the wheelhouse
+    # whose SHA256 matches. pip's cache only speeds up resolution, the
+    # project wheel build and the pip download paths (lock file, --target,
+    # fallback). An explicit cache dir lets CI jobs share it.
+    cache: list[str] = []
+    if args.cache_dir is not None:
+        cache = ["--cache-dir", str(args.cache_dir)]
 
-    print(f"\nWheelhouse ready at: {out_dir.resolve()}")
-    print(f"Files: {len(list(out_dir.glob('*.whl')))} wheels")
-    print(f"\nTo install offline:\n  pip install --no-index --find-links {out_dir} sudapy[all]")
+    if lock is not None:
+        requirements = ["-r", str(lock), "--require-hashes", "--no-deps"]
+        print(f"Downloading wheels pinned in {lock} into {out_dir} ...")
+    else:
+        requirements = [install_spec]
+        print(f"Downloading wheels for {install_spec} into {out_dir} ...")
+
+    # Building in an isolated env makes pip install the build backend
+    # into a throwaway venv first. Skip that when hatchling is already
+    # importable here (e.g. after ``pip install hatchling``).
+    isolation: list[str] = []
+    if importlib.util.find_spec("hatchling") is not None:
+        isolation = ["--no-build-isolation"]
+
+    # The two stages write disjoint files, so run them side by side:
+    # build the project wheel itself while the dependencies download.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        wheel_stage = pool.submit(
+            _run_stage,
+            "wheel",
+            [
+                sys.executable, "-m", "pip", "wheel", str(project_root),
+                "--wheel-dir", str(out_dir), "--no-deps", "--progress-bar", "off",
+                *isolation, *parallel, *cache,
+            ],
+        )
+        if targets:
+            _download_targets(requirements, out_dir, targets, [*parallel, *cache])
+        elif lock is not None:
+            _run_stage(
+                "download",
+                [
+                    sys.executable, "-m", "pip", "download", *requirements,
+                    "--dest", str(out_dir), "--progress-bar", "off", *parallel, *cache,
+                ],
+            )
+        else:
+            _download_dependencies(
+                install_spec,
+                out_dir,
+                args.jobs,
+                cache,
+                [
+                    sys.executable, "-m", "pip", "download", install_spec,
+                    "--dest", str(out_dir), "--progress-bar", "off", *parallel, *cache,
+                ],
+                _plan_cache_dir(args.cache_dir) / f"plan-{_plan_key(project_root, args.extras)}.json",
+                refresh=args.refresh,
+            )
+        wheel_stage.result()
+
+    if not targets:
+        print(f"\nWheelhouse ready at: {out_dir.resolve()}")
+        print(f"Files: {_count_wheels(out_dir)} wheels")
+        print(f"\nTo install offline:\n  pip install --no-index --find-links {out_dir} sudapy[all]")
+        return
+
+    # The SudaPy wheel is pure Python; copy it into every target directory
+    # so each one installs on its own.
+    project_wheels = sorted(out_dir.glob("sudapy-*.whl"))
+    for target, _, _ in targets:
+        target_dir = out_dir / target
+        for wheel in project_wheels:
+            shutil.copy2(wheel, target_dir / wheel.name)
+        print(f"\nWheelhouse for {target} ready at: {target_dir.resolve()}")
+        print(f"Files: {_count_wheels(target_dir)} wheels")
+    print(
+        f"\nTo install offline:\n  pip install --no-index --find-links {out_dir}/<target> sudapy[all]"
+    )
 
 
 if __name__ == "__main__":
@@ -19,6 +19,6 @@ REM Activate the conda environment
 call "%SUDAPY_ENV%\Scripts\activate.bat"
 
 REM Forward all arguments to sudapy CLI
-python -m sudapy.cli.main %*
+python -m sudapy.cli %*
 
 endlocal
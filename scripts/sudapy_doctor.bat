@@ -1,4 +1,4 @@
 @echo off
 REM Quick health check -- double-click to verify your SudaPy installation
-call "%~dp0run_sudapy.bat" doctor
+call "%~dp0run_sudapy.bat" doctor all --gpkg
 pause
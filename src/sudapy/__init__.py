@@ -4,14 +4,28 @@ Provides GIS, remote sensing, and surveying workflows optimized
 for professionals working in Sudan and the surrounding region.
 """
 
-import platform
-import struct
-import warnings
+import sys
+
+# pyproject.toml is the single source of truth for the version; the build
+# backend writes it to _version.py when the package is built or installed.
+try:
+    from sudapy._version import __version__
+except ImportError:  # running from a source tree that was never built
+    from importlib.metadata import PackageNotFoundError
+    from importlib.metadata import version as _version
+
+    try:
+        __version__ = _version("sudapy")
+    except PackageNotFoundError:
+        __version__ = "0.0.0+unknown"
 
-__version__ = "1.2.1"
 __all__ = ["__version__"]
 
-if platform.system() == "Windows" and struct.calcsize("P") * 8 == 32:
+# sys.maxsize reflects the interpreter's pointer size, so the common
+# 64-bit path costs one string compare and one integer compare.
+if sys.platform == "win32" and sys.maxsize <= 2**32:
+    import warnings
+
     warnings.warn(
         "SudaPy is running on 32-bit Windows. "
         "Core CRS functions work, but geospatial extras ([geo], [viz]) "
@@ -0,0 +1,26 @@
+"""SudaPy command-line interface package."""
+
+from __future__ import annotations
+
+import sys
+
+
+def main() -> None:
+    """Console-script entry point.
+
+    ``sudapy --version`` is answered here without importing Typer or any
+    command module. When the first argument names a command group, only
+    that group is imported and registered; anything else (root commands,
+    ``--help``, no arguments) gets the full app so the help listing stays
+    complete.
+    """
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        from sudapy import __version__
+
+        print(f"sudapy {__version__}")
+        return
+
+    from sudapy.cli._app import GROUPS, make_app
+
+    first = sys.argv[1] if len(sys.argv) > 1 else None
+    make_app(first if first in GROUPS else None)()
@@ -0,0 +1,5 @@
+"""Allow ``python -m sudapy.cli``."""
+
+from sudapy.cli import main
+
+main()
@@ -0,0 +1,64 @@
+"""Construction of the root Typer app.
+
+Kept apart from :mod:`sudapy.cli.main` so :func:`sudapy.cli.main` can build
+an app holding just the group named on the command line.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Optional
+
+import typer
+
+# Each group lives in its own module, and the top-level commands in
+# sudapy.cli._commands. Group modules import their heavy dependencies inside
+# each command, so registering all of them stays cheap.
+GROUPS = {
+    "crs": "sudapy.cli._crs",
+    "vector": "sudapy.cli._vector",
+    "raster": "sudapy.cli._raster",
+    "map": "sudapy.cli._map",
+    "rs": "sudapy.cli._rs",
+    "doctor": "sudapy.cli._doctor",
+}
+
+
+def _version_callback(value: bool) -> None:
+    if value:
+        from sudapy import __version__
+
+        typer.echo(f"sudapy {__version__}")
+        raise typer.Exit()
+
+
+def _root(
+    version: Optional[bool] = typer.Option(
+        None, "--version", "-V", callback=_version_callback, is_eager=True,
+        help="Show the SudaPy version and exit.",
+    ),
+) -> None:
+    # The fast path in sudapy.cli.main() answers --version before Typer is
+    # imported; this option keeps it listed in --help and working for
+    # ``python -m sudapy.cli.main``.
+    pass
+
+
+def make_app(group: Optional[str] = None) -> typer.Typer:
+    """Return the root app with every command, or only the *group* sub-app."""
+    app = typer.Typer(
+        name="sudapy",
+        help="SudaPy: Sudan-focused Python toolkit for Geomatics.",
+        add_completion=False,
+        no_args_is_help=True,
+        rich_markup_mode="rich",
+    )
+    app.callback()(_root)
+    if group is None:
+        importlib.import_module("sudapy.cli._commands").register(app)
+        names = list(GROUPS)
+    else:
+        names = [group]
+    for name in names:
+        app.add_typer(importlib.import_module(GROUPS[name]).app, name=name)
+    return app
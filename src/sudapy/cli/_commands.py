@@ -0,0 +1,334 @@
+"""Top-level commands: ``sudapy info``, ``init``, ``report`` and ``batch``."""
+
+from __future__ import annotations
+
+import functools
+import os
+import sys
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from sudapy.cli._common import (
+    FORMAT_HELP,
+    Cell,
+    OutputFormat,
+    console,
+    handle_error,
+    print_table,
+)
+
+
+def register(app: typer.Typer) -> None:
+    """Attach the top-level commands to the root *app*."""
+    for command in (info, init, report, batch):
+        app.command()(command)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+@functools.cache
+def _check_module(name: str) -> tuple[str, str]:
+    """Return (version, status_style) for a distribution, without importing it."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version(name), "green"
+    except PackageNotFoundError:
+        return "not installed", "red"
+
+
+# ---------------------------------------------------------------------------
+# sudapy info
+# ---------------------------------------------------------------------------
+
+def info(
+    deep: bool = typer.Option(
+        False, "--deep", help="Also import rasterio to report the GDAL version."
+    ),
+    fmt: OutputFormat = typer.Option(OutputFormat.table, "--format", help=FORMAT_HELP),
+) -> None:
+    """Show SudaPy version, environment, and key dependency info."""
+    import platform
+
+    from sudapy import __version__
+
+    rows: list[list[Cell]] = [
+        ["SudaPy version", __version__],
+        ["Python", sys.version.split()[0]],
+        ["Platform", platform.platform()],
+    ]
+
+    for mod_name in ("geopandas", "shapely", "fiona", "pyproj", "rasterio", "numpy", "pandas"):
+        ver, style = _check_module(mod_name)
+        rows.append([mod_name, (ver, style)])
+
+    # Loading GDAL is what makes this command slow, so it is opt-in.
+    if deep:
+        try:
+            import rasterio
+            rows.append(["GDAL (via rasterio)", rasterio.gdal_version()])
+        except Exception:
+            rows.append(["GDAL", ("unavailable", "red")])
+
+    print_table(
+        "SudaPy Environment",
+        [("Component", {"style": "cyan"}), ("Value", {"style": "green"})],
+        rows,
+        show_lines=True,
+        fmt=fmt,
+    )
+
+
+# ---------------------------------------------------------------------------
+# sudapy init
+# ---------------------------------------------------------------------------
+
+def init(
+    name: str = typer.Argument(..., help="Project folder name to create."),
+) -> None:
+    """Scaffold a standard geomatics project folder structure."""
+    root = Path(name)
+    if root.exists():
+        console().print(f"[bold red]Error:[/bold red] Directory '{name}' already exists.")
+        raise typer.Exit(code=1)
+
+    folders = [
+        root / "data_raw",
+        root / "data_clean",
+        root / "outputs",
+        root / "maps",
+        root / "scripts",
+    ]
+    # root is known not to exist, so create it (and any parents) once and
+    # make the sub-folders with plain mkdir calls: no per-folder stat.
+    root.mkdir(parents=True)
+    for folder in folders:
+        os.mkdir(folder)
+
+    # Create a minimal README
+    (root / "README.md").write_bytes((
+        f"# {name}\n\n"
+        f"Geomatics project created with [SudaPy](https://pypi.org/project/sudapy/).\n\n"
+        f"## Folder structure\n\n"
+        f"- `data_raw/` -- original source data (do not modify)\n"
+        f"- `data_clean/` -- cleaned / processed data\n"
+        f"- `outputs/` -- analysis results, tables, statistics\n"
+        f"- `maps/` -- exported maps (PNG, HTML)\n"
+        f"- `scripts/` -- processing scripts\n"
+    ).encode())
+
+    # Create a placeholder script
+    (root / "scripts" / "process.py").write_bytes(
+        b'"""Processing script -- edit this for your workflow."""\n\n'
+        b"from sudapy.crs.registry import suggest_utm_zone\n"
+        b"from sudapy.vector.ops import reproject\n\n"
+        b"# Example: suggest CRS for Khartoum\n"
+        b"print(suggest_utm_zone(lon=32.5, lat=15.6))\n"
+    )
+
+    # typer.secho goes through click, which drops the colour when piped,
+    # so this path never needs rich.
+    typer.secho(f"Project '{name}' created with folders:", fg="green")
+    typer.echo("\n".join(f"  {folder}/" for folder in folders))
+
+
+# ---------------------------------------------------------------------------
+# sudapy report
+# ---------------------------------------------------------------------------
+
+# shapely.get_type_id() codes -> GeoSeries.geom_type names
+_GEOM_TYPE_NAMES = {
+    0: "Point",
+    1: "LineString",
+    2: "LinearRing",
+    3: "Polygon",
+    4: "MultiPoint",
+    5: "MultiLineString",
+    6: "MultiPolygon",
+    7: "GeometryCollection",
+}
+
+
+def report(
+    input_path: Path = typer.Option(..., "--in", help="Input vector file."),
+    fmt: OutputFormat = typer.Option(OutputFormat.table, "--format", help=FORMAT_HELP),
+) -> None:
+    """Print a summary report for a vector dataset."""
+    try:
+        import geopandas as gpd
+    except ImportError:
+        handle_error(Exception('geopandas is required. Install with: pip install "sudapy[geo]"'))
+        return
+
+    try:
+        gdf = gpd.read_file(input_path)
+    except Exception as exc:
+        handle_error(exc)
+        return
+
+    import numpy as np
+    import shapely
+
+    # Fetch the raw shapely array once and run every per-geometry query on it
+    # as a GEOS array loop, rather than through repeated GeoSeries accessors.
+    geoms = np.asarray(gdf.geometry.array)
+    type_ids = np.unique(shapely.get_type_id(geoms))
+    geom_types = ", ".join(sorted(_GEOM_TYPE_NAMES[int(i)] for i in type_ids if i >= 0))
+
+    rows: list[list[Cell]] = [
+        ["Features", str(len(gdf))],
+        ["Columns", ", ".join(gdf.columns.tolist())],
+        ["Geometry type", geom_types or "-"],
+        ["CRS", str(gdf.crs) if gdf.crs else ("None", "red")],
+    ]
+
+    bounds = shapely.total_bounds(geoms)
+    rows.append(["Bounds (minx, miny, maxx, maxy)",
+                 f"{bounds[0]:.6f}, {bounds[1]:.6f}, {bounds[2]:.6f}, {bounds[3]:.6f}"])
+
+    # Null geometries
+    null_count = int(shapely.is_missing(geoms).sum())
+    style = "red" if null_count > 0 else "green"
+    rows.append(["Null geometries", (null_count, style)])
+
+    # Invalid geometries
+    try:
+        invalid_count = int((~shapely.is_valid(geoms)).sum())
+        style = "red" if invalid_count > 0 else "green"
+        rows.append(["Invalid geometries", (invalid_count, style)])
+    except Exception:
+        rows.append(["Invalid geometries", ("could not check", "yellow")])
+
+    print_table(
+        f"Report: {input_path.name}",
+        [("Property", {"style": "cyan"}), ("Value", {"style": "green"})],
+        rows,
+        show_lines=True,
+        fmt=fmt,
+    )
+
+
+# ---------------------------------------------------------------------------
+# sudapy batch
+# ---------------------------------------------------------------------------
+
+# operation -> (parameter it needs, option named in the error) or None
+_BATCH_REQUIRED: dict[str, Optional[tuple[str, str]]] = {
+    "reproject": ("to", "--to EPSG"),
+    "clip": ("clip_path", "--clip path"),
+    "buffer": ("distance", "--distance"),
+    "area": None,
+    "simplify": ("tolerance", "--tolerance"),
+    "fix-geometry": None,
+}
+
+
+def _run_batch_one(operation: str, src: Path, out: Path, params: dict) -> None:
+    """Apply one batch *operation* to *src*, writing *out*.
+
+    Lives at module scope so worker processes can unpickle it.
+    """
+    from sudapy.vector import ops as vops
+
+    if operation == "reproject":
+        vops.reproject(src, to_epsg=params["to"], out=out)
+    elif operation == "clip":
+        vops.clip(src, params["clip_path"], out=out)
+    elif operation == "buffer":
+        vops.buffer(src, distance_m=params["distance"], out=out)
+    elif operation == "area":
+        vops.calculate_area(src, field=params["field"], out=out)
+    elif operation == "simplify":
+        vops.simplify(src, tolerance_m=params["tolerance"], out=out)
+    elif operation == "fix-geometry":
+        vops.fix_geometry(src, out=out)
+
+
+def batch(
+    operation: str = typer.Argument(
+        ...,
+        help="Operation to run: reproject, clip, buffer, area, simplify, fix-geometry.",
+    ),
+    input_dir: Path = typer.Option(..., "--in", help="Input directory with vector files."),
+    output_dir: Path = typer.Option(..., "--out", help="Output directory."),
+    to: Optional[int] = typer.Option(None, "--to", help="Target EPSG (for reproject)."),
+    clip_path: Optional[Path] = typer.Option(None, "--clip", help="Clip geometry file."),
+    distance: Optional[float] = typer.Option(None, "--distance", help="Buffer distance in meters."),
+    field: str = typer.Option("area_m2", "--field", help="Field name (for area)."),
+    tolerance: Optional[float] = typer.Option(None, "--tolerance", help="Simplify tolerance in meters."),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j", min=1,
+        help="Worker processes (default: CPU count). Use 1 to run sequentially.",
+    ),
+) -> None:
+    """Run an operation on all vector files in a directory."""
+    if operation not in _BATCH_REQUIRED:
+        handle_error(Exception(
+            f"Unknown operation '{operation}'. "
+            "Supported: reproject, clip, buffer, area, simplify, fix-geometry"
+        ))
+    params = {
+        "to": to, "clip_path": clip_path, "distance": distance,
+        "field": field, "tolerance": tolerance,
+    }
+    required = _BATCH_REQUIRED[operation]
+    if required is not None and params[required[0]] is None:
+        handle_error(Exception(f"{required[1]} is required for {operation}"))
+
+    # scandir filters on the cached directory entry, so Path objects are only
+    # built for the files that will actually be processed.
+    SUPPORTED_EXTS = {".gpkg", ".geojson", ".json", ".shp", ".parquet", ".geoparquet"}
+    with os.scandir(input_dir) as it:
+        files = sorted(
+            Path(e.path) for e in it
+            if os.path.splitext(e.name)[1].lower() in SUPPORTED_EXTS and e.is_file()
+        )
+
+    if not files:
+        typer.secho(f"No vector files found in {input_dir}", fg="yellow")
+        raise typer.Exit(code=1)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    typer.echo(f"Processing {len(files)} files with operation '{operation}' ...")
+
+    # Each file is an independent GDAL/shapely round-trip, so they fan out
+    # across processes. Results are reported in file order regardless.
+    errors: dict[Path, Optional[Exception]] = {}
+    workers = min(jobs or os.cpu_count() or 1, len(files))
+    if workers == 1:
+        for f in files:
+            try:
+                _run_batch_one(operation, f, output_dir / f.name, params)
+                errors[f] = None
+            except Exception as exc:
+                errors[f] = exc
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            futures = {
+                ex.submit(_run_batch_one, operation, f, output_dir / f.name, params): f
+                for f in files
+            }
+            for fut in as_completed(futures):
+                errors[futures[fut]] = fut.exception()
+
+    # Per-file status lines are collected and written in one call, through
+    # click rather than rich: rendering each line separately dominates large
+    # batches.
+    lines: list[str] = []
+    ok_count = 0
+    for f in files:
+        exc = errors[f]
+        if exc is None:
+            ok_count += 1
+            lines.append(f"  {typer.style('OK', fg='green')} {f.name}")
+        else:
+            lines.append(f"  {typer.style('FAIL', fg='red')} {f.name}: {exc}")
+
+    typer.echo("\n".join(lines))
+    typer.secho(f"\n{ok_count}/{len(files)} files processed -> {output_dir}", fg="green")
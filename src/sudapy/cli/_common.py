@@ -0,0 +1,134 @@
+"""Helpers shared by the CLI command modules."""
+
+from __future__ import annotations
+
+import os
+import sys
+from collections.abc import Iterable, Sequence
+from enum import Enum
+from typing import Any, Union
+
+import typer
+
+# A table cell: a value, or ``(value, rich_style)``. Numbers and ``None`` stay
+# native in JSON output and are converted to text everywhere else.
+Value = Union[str, int, float, None]
+Cell = Union[Value, tuple[Value, str]]
+
+
+class OutputFormat(str, Enum):
+    """Values accepted by the ``--format`` option of table-printing commands."""
+
+    table = "table"
+    json = "json"
+    csv = "csv"
+
+
+FORMAT_HELP = "Output format: table, json or csv."
+
+_console_instance = None
+
+
+def console():
+    """Return the shared rich console, importing rich on first use.
+
+    ``sudapy --help`` never prints through it, so deferring the import keeps
+    startup down to what Typer itself needs.
+    """
+    global _console_instance
+    if _console_instance is None:
+        from rich.console import Console
+
+        _console_instance = Console()
+    return _console_instance
+
+
+def handle_error(exc: Exception) -> None:
+    """Print a rich-formatted error and exit."""
+    console().print(f"[bold red]Error:[/bold red] {exc}")
+    # A DependencyError can only exist if its module was imported, so look it
+    # up instead of importing sudapy.core.errors on every error path.
+    errors = sys.modules.get("sudapy.core.errors")
+    if errors is not None and isinstance(exc, errors.DependencyError) and exc.hint:
+        console().print(f"[yellow]Install the missing extra:[/yellow] {exc.hint}")
+    raise typer.Exit(code=1)
+
+
+def plain_output() -> bool:
+    """Whether tables should be written as plain tab-separated lines.
+
+    ``SUDAPY_PLAIN=1`` forces plain output and ``SUDAPY_PLAIN=0`` forces rich
+    tables; otherwise plain output is used whenever stdout is not a terminal.
+    """
+    env = os.environ.get("SUDAPY_PLAIN")
+    if env is not None:
+        return env != "0"
+    return not sys.stdout.isatty()
+
+
+def _value(cell: Cell) -> Value:
+    """Return the value of *cell*, without its rich style."""
+    return cell[0] if isinstance(cell, tuple) else cell
+
+
+def _text(cell: Cell) -> str:
+    """Return *cell* as display text; ``None`` becomes an empty string."""
+    value = _value(cell)
+    return "" if value is None else str(value)
+
+
+def print_table(
+    title: str,
+    columns: Sequence[tuple[str, dict[str, Any]]],
+    rows: Iterable[Sequence[Cell]],
+    show_lines: bool = False,
+    fmt: OutputFormat = OutputFormat.table,
+) -> None:
+    """Print *rows* under *columns* as a rich table, or as TSV when piped.
+
+    Args:
+        title: Table title (rich output only).
+        columns: ``(header, options)`` pairs; options go to
+            ``rich.table.Table.add_column``.
+        rows: Cell sequences, one per row.
+        show_lines: Draw lines between rows (rich output only).
+        fmt: ``json`` writes a list of ``{header: value}`` records, keeping
+            numbers and ``None`` as JSON numbers and ``null``; ``csv`` writes
+            a header row plus rows. Neither touches rich.
+    """
+    if fmt is not OutputFormat.table:
+        headers = [header for header, _ in columns]
+        if fmt is OutputFormat.json:
+            import json
+
+            records = [dict(zip(headers, map(_value, row))) for row in rows]
+            json.dump(records, sys.stdout, indent=2)
+            sys.stdout.write("\n")
+        else:
+            import csv
+
+            writer = csv.writer(sys.stdout, lineterminator="\n")
+            writer.writerow(headers)
+            writer.writerows([_text(c) for c in row] for row in rows)
+        return
+
+    if plain_output():
+        # Skip rich entirely: no markup parsing, layout or segment rendering.
+        lines = ["\t".join(header for header, _ in columns)]
+        for row in rows:
+            lines.append("\t".join(_text(c) for c in row))
+        sys.stdout.write("\n".join(lines) + "\n")
+        return
+
+    from rich.markup import escape
+    from rich.table import Table
+
+    table = Table(title=title, show_lines=show_lines)
+    for header, options in columns:
+        table.add_column(header, **options)
+    for row in rows:
+        table.add_row(*(
+            f"[{c[1]}]{escape(_text(c))}[/{c[1]}]" if isinstance(c, tuple) else escape(_text(c))
+            for c in row
+        ))
+    console().print(table)
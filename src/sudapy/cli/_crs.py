@@ -0,0 +1,64 @@
+"""CRS preset and UTM-suggestion commands (``sudapy crs ...``)."""
+
+from __future__ import annotations
+
+import typer
+
+from sudapy.cli._common import FORMAT_HELP, OutputFormat, handle_error, print_table
+
+app = typer.Typer(help="Coordinate Reference System utilities.")
+
+
+# ---------------------------------------------------------------------------
+# sudapy crs list
+# ---------------------------------------------------------------------------
+
+@app.command("list")
+def crs_list(
+    fmt: OutputFormat = typer.Option(OutputFormat.table, "--format", help=FORMAT_HELP),
+) -> None:
+    """Show common CRS presets used in Sudan."""
+    from sudapy.crs.registry import list_presets
+
+    print_table(
+        "Sudan CRS Presets",
+        [
+            ("EPSG", {"style": "cyan", "justify": "right"}),
+            ("Name", {"style": "green"}),
+            ("Region", {"style": "yellow"}),
+            ("Description", {}),
+        ],
+        [[p.epsg, p.name, p.region, p.description] for p in list_presets()],
+        fmt=fmt,
+    )
+
+
+# ---------------------------------------------------------------------------
+# sudapy crs suggest
+# ---------------------------------------------------------------------------
+
+@app.command("suggest")
+def crs_suggest(
+    lon: float = typer.Option(..., "--lon", help="Longitude in decimal degrees."),
+    lat: float = typer.Option(..., "--lat", help="Latitude in decimal degrees."),
+    fmt: OutputFormat = typer.Option(OutputFormat.table, "--format", help=FORMAT_HELP),
+) -> None:
+    """Suggest the most likely UTM zone / EPSG for a coordinate."""
+    from sudapy.crs.registry import suggest_utm_zone
+
+    try:
+        suggestions = suggest_utm_zone(lon, lat)
+    except ValueError as exc:
+        handle_error(exc)
+        return
+
+    print_table(
+        f"CRS Suggestions for ({lon}, {lat})",
+        [
+            ("EPSG", {"style": "cyan", "justify": "right"}),
+            ("Name", {"style": "green"}),
+            ("Datum", {}),
+        ],
+        [[s["epsg"], s["name"], s["datum"]] for s in suggestions],
+        fmt=fmt,
+    )
@@ -0,0 +1,312 @@
+"""Environment diagnostics (``sudapy doctor ...``).
+
+``sudapy doctor`` on its own runs only the core checks, so the common "is my
+install broken?" question skips the heavy geo imports. ``geo``, ``rs`` and
+``all`` opt into the rest; the GeoPackage write/read round-trip additionally
+needs ``--gpkg``.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from sudapy.cli._common import Cell, console, print_table
+
+app = typer.Typer(
+    help="Run diagnostics to check if SudaPy's environment is healthy.",
+    invoke_without_command=True,
+)
+
+# status can be: True (PASS), False (FAIL), or None (SKIP/optional missing)
+Check = tuple[str, Optional[bool], str]
+
+_STATUS: dict[Optional[bool], Cell] = {
+    True: ("PASS", "green"),
+    False: ("FAIL", "red"),
+    None: ("SKIP", "yellow"),
+}
+
+# A passing PROJ probe is trusted for this long (see _proj_check).
+_PROJ_CACHE_TTL = 24 * 60 * 60
+
+# Set by the ``--no-cache`` option of the doctor callback.
+_use_cache = True
+
+
+# ---------------------------------------------------------------------------
+# Probes
+# ---------------------------------------------------------------------------
+
+@functools.cache
+def _importable(module: str) -> bool:
+    """Return whether *module* imports; each module is probed once per process."""
+    try:
+        __import__(module)
+    except ImportError:
+        return False
+    return True
+
+
+def _import_checks(
+    modules: list[tuple[str, str]], missing: Optional[bool], hint: str
+) -> list[Check]:
+    """Try each ``(module, label)``; record *missing* with *hint* on ImportError."""
+    return [
+        (label, True, "OK") if _importable(mod) else (label, missing, hint)
+        for mod, label in modules
+    ]
+
+
+def _core_checks() -> list[Check]:
+    """Python version, required imports and PROJ data."""
+    checks: list[Check] = []
+
+    py_ver = sys.version_info
+    ok = py_ver >= (3, 9)
+    checks.append((
+        "Python >= 3.9",
+        ok,
+        f"{py_ver.major}.{py_ver.minor}.{py_ver.micro}" + ("" if ok else " -- upgrade to 3.9+"),
+    ))
+
+    checks += _import_checks(
+        [("pyproj", "pyproj import"), ("pandas", "pandas import")],
+        False,
+        "not installed -- pip install sudapy",
+    )
+
+    checks.append(_proj_check())
+
+    return checks
+
+
+def _proj_check() -> Check:
+    """Look up a UTM CRS in proj.db, reusing a recent PASS from the disk cache.
+
+    The cache key covers the pyproj version and the proj.db path and mtime,
+    so upgrading pyproj or replacing PROJ data forces a fresh probe.
+    """
+    label = "PROJ data available"
+    try:
+        import pyproj
+        from pyproj.datadir import get_data_dir
+
+        proj_db = os.path.join(get_data_dir(), "proj.db")
+        key = f"{pyproj.__version__}|{proj_db}|{os.stat(proj_db).st_mtime_ns}"
+    except Exception as exc:
+        return (label, False, str(exc))
+
+    cache_file = _cache_dir() / "doctor.json"
+    if _use_cache:
+        try:
+            cached = json.loads(cache_file.read_text(encoding="utf-8"))
+            if cached["key"] == key and time.time() - cached["time"] < _PROJ_CACHE_TTL:
+                return (label, True, f"OK ({cached['name']}, cached)")
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    try:
+        crs = pyproj.CRS.from_epsg(32636)
+    except Exception as exc:
+        return (label, False, str(exc))
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(
+            json.dumps({"key": key, "time": time.time(), "name": crs.name}), encoding="utf-8"
+        )
+    except OSError:
+        pass  # the cache is an optimisation only
+    return (label, True, f"OK ({crs.name})")
+
+
+def _cache_dir() -> Path:
+    """Return SudaPy's cache directory.
+
+    That is ``%LOCALAPPDATA%\\sudapy`` on Windows, else ``$XDG_CACHE_HOME/sudapy``
+    or ``~/.cache/sudapy``.
+    """
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        base = os.environ["LOCALAPPDATA"]
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "sudapy"
+
+
+def _geo_checks(gpkg_roundtrip: bool = False) -> list[Check]:
+    """Optional ``sudapy[geo]`` imports, GDAL and GeoPackage support.
+
+    GeoPackage support is read from the OGR driver table unless
+    *gpkg_roundtrip* asks for an actual write/read of a temporary file.
+    """
+    checks = _import_checks(
+        [
+            ("geopandas", "geopandas import (optional)"),
+            ("shapely", "shapely import (optional)"),
+            ("fiona", "fiona import (optional)"),
+            ("numpy", "numpy import (optional)"),
+        ],
+        None,
+        'not installed -- pip install "sudapy[geo]"',
+    )
+
+    try:
+        import rasterio
+        checks.append(("rasterio import (optional)", True, f"OK (GDAL {rasterio.gdal_version()})"))
+    except ImportError:
+        checks.append((
+            "rasterio import (optional)",
+            None,
+            'not installed -- pip install "sudapy[geo]"',
+        ))
+
+    checks.append(_gpkg_roundtrip_check() if gpkg_roundtrip else _gpkg_driver_check())
+    return checks
+
+
+def _gpkg_driver_check() -> Check:
+    """Check that OGR's GPKG driver can write, without touching the disk."""
+    label = "GeoPackage driver"
+    try:
+        try:
+            from pyogrio import list_drivers
+
+            mode = list_drivers().get("GPKG", "")
+        except ImportError:
+            from fiona import supported_drivers
+
+            mode = supported_drivers.get("GPKG", "")
+    except ImportError:
+        return (label, None, 'skipped -- install "sudapy[geo]" first')
+    if "w" in mode:
+        return (label, True, f"OK ({mode})")
+    return (label, False, f"GPKG driver missing or read-only ({mode or 'not found'})")
+
+
+def _gpkg_roundtrip_check() -> Check:
+    """Write and read back a one-feature GeoPackage in a temporary file."""
+    try:
+        import tempfile
+
+        import geopandas as gpd
+        from shapely.geometry import Point
+
+        gdf = gpd.GeoDataFrame({"val": [1]}, geometry=[Point(0, 0)], crs="EPSG:4326")
+        with tempfile.NamedTemporaryFile(suffix=".gpkg", delete=False) as tmp:
+            tmp_path = tmp.name
+        gdf.to_file(tmp_path, driver="GPKG")
+        gpd.read_file(tmp_path)
+        os.unlink(tmp_path)
+        return ("GeoPackage read/write", True, "OK")
+    except ImportError:
+        return ("GeoPackage read/write", None, 'skipped -- install "sudapy[geo]" first')
+    except Exception as exc:
+        return ("GeoPackage read/write", False, str(exc))
+
+
+def _rs_checks() -> list[Check]:
+    """Optional ``sudapy[rs]`` imports."""
+    return _import_checks(
+        [
+            ("sentinelsat", "sentinelsat import (optional)"),
+            ("earthpy", "earthpy import (optional)"),
+        ],
+        None,
+        'not installed -- pip install "sudapy[rs]"',
+    )
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+def _report(checks: list[Check], footer: str) -> None:
+    """Print *checks* as a table, followed by *footer* if every check passed."""
+    print_table(
+        "SudaPy Doctor",
+        [("Check", {"style": "cyan"}), ("Status", {}), ("Details", {})],
+        [[label, _STATUS[ok], detail] for label, ok, detail in checks],
+    )
+
+    statuses = {ok for _, ok, _ in checks}
+    has_fail = False in statuses
+    has_skip = None in statuses
+
+    if has_fail:
+        console().print(
+            "\n[bold red]Some checks failed.[/bold red] See hints above."
+        )
+    elif has_skip:
+        console().print(
+            "\n[bold green]Required checks passed.[/bold green] "
+            "Optional dependencies marked SKIP are not installed."
+        )
+    else:
+        console().print(f"\n[bold green]Checks passed.[/bold green] {footer}")
+
+
+# ---------------------------------------------------------------------------
+# Commands
+# ---------------------------------------------------------------------------
+
+@app.callback()
+def doctor(
+    ctx: typer.Context,
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Re-probe PROJ data instead of using a cached result."
+    ),
+) -> None:
+    """Run diagnostics to check if SudaPy's environment is healthy.
+
+    Without a sub-command, only the core checks run.
+    """
+    global _use_cache
+    _use_cache = not no_cache
+    if ctx.invoked_subcommand is None:
+        doctor_core()
+
+
+@app.command("core")
+def doctor_core() -> None:
+    """Check Python, pyproj, pandas and PROJ data."""
+    _report(
+        _core_checks(),
+        "Run 'sudapy doctor geo' to check vector/raster support.",
+    )
+
+
+@app.command("geo")
+def doctor_geo(
+    gpkg: bool = typer.Option(
+        False, "--gpkg", help="Write and read back a real GeoPackage file."
+    ),
+) -> None:
+    """Check the geo extra (geopandas, shapely, fiona, rasterio) and GeoPackage support."""
+    _report(_geo_checks(gpkg), "Vector and raster support is ready.")
+
+
+@app.command("rs")
+def doctor_rs() -> None:
+    """Check the remote sensing extra (sentinelsat, earthpy)."""
+    _report(_rs_checks(), "Remote sensing support is ready.")
+
+
+@app.command("all")
+def doctor_all(
+    gpkg: bool = typer.Option(
+        False, "--gpkg", help="Write and read back a real GeoPackage file."
+    ),
+) -> None:
+    """Run every check."""
+    _report(
+        _core_checks() + _geo_checks(gpkg) + _rs_checks(),
+        "SudaPy's environment is healthy.",
+    )
@@ -0,0 +1,30 @@
+"""Quick visualization commands (``sudapy map ...``)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import typer
+
+from sudapy.cli._common import console, handle_error
+
+app = typer.Typer(help="Quick map visualization.")
+
+
+# ---------------------------------------------------------------------------
+# sudapy map quick
+# ---------------------------------------------------------------------------
+
+@app.command("quick")
+def map_quick(
+    input_path: Path = typer.Option(..., "--in", help="Input vector or raster file."),
+    output_path: Path = typer.Option(..., "--out", help="Output .png or .html file."),
+) -> None:
+    """Generate a quick visualization of a dataset."""
+    from sudapy.viz.maps import quick_map
+
+    try:
+        quick_map(input_path, output_path)
+        console().print(f"[green]Map exported -> {output_path}[/green]")
+    except Exception as exc:
+        handle_error(exc)
@@ -0,0 +1,133 @@
+"""Raster geoprocessing commands (``sudapy raster ...``)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import typer
+
+from sudapy.cli._common import console, handle_error
+
+app = typer.Typer(help="Raster geoprocessing operations.")
+
+
+# ---------------------------------------------------------------------------
+# sudapy raster clip
+# ---------------------------------------------------------------------------
+
+@app.command("clip")
+def raster_clip(
+    input_path: Path = typer.Option(..., "--in", help="Input raster file."),
+    clip_path: Path = typer.Option(..., "--clip", help="Clipping vector file."),
+    output_path: Path = typer.Option(..., "--out", help="Output raster file."),
+) -> None:
+    """Clip a raster by vector geometries."""
+    from sudapy.raster.ops import clip
+
+    try:
+        clip(input_path, clip_path, out=output_path)
+        console().print(f"[green]Raster clipped -> {output_path}[/green]")
+    except Exception as exc:
+        handle_error(exc)
+
+
+# ---------------------------------------------------------------------------
+# sudapy raster reproject
+# ---------------------------------------------------------------------------
+
+@app.command("reproject")
+def raster_reproject(
+    input_path: Path = typer.Option(..., "--in", help="Input raster file."),
+    output_path: Path = typer.Option(..., "--out", help="Output raster file."),
+    to: int = typer.Option(..., "--to", help="Target EPSG code."),
+) -> None:
+    """Reproject a raster to a new CRS."""
+    from sudapy.raster.ops import reproject_raster
+
+    try:
+        reproject_raster(input_path, output_path, to_epsg=to)
+        console().print(f"[green]Raster reprojected to EPSG:{to} -> {output_path}[/green]")
+    except Exception as exc:
+        handle_error(exc)
+
+
+# ---------------------------------------------------------------------------
+# sudapy raster resample
+# ---------------------------------------------------------------------------
+
+@app.command("resample")
+def raster_resample(
+    input_path: Path = typer.Option(..., "--in", help="Input raster file."),
+    output_path: Path = typer.Option(..., "--out", help="Output raster file."),
+    scale: float = typer.Option(..., "--scale", help="Scale factor (2.0 = double resolution)."),
+    method: str = typer.Option(
+        "bilinear", "--method", help="Resampling: nearest, bilinear, cubic, lanczos, average.",
+    ),
+) -> None:
+    """Resample a raster to a different resolution."""
+    from sudapy.raster.ops import resample
+
+    try:
+        resample(input_path, output_path, scale_factor=scale, method=method)
+        console().print(f"[green]Resampled (x{scale}, {method}) -> {output_path}[/green]")
+    except Exception as exc:
+        handle_error(exc)
+
+
+# ---------------------------------------------------------------------------
+# sudapy raster mosaic
+# ---------------------------------------------------------------------------
+
+@app.command("mosaic")
+def raster_mosaic(
+    input_dir: Path = typer.Option(..., "--in", help="Directory with raster tiles."),
+    output_path: Path = typer.Option(..., "--out", help="Output merged raster file."),
+) -> None:
+    """Merge multiple raster tiles into one."""
+    from sudapy.raster.ops import mosaic
+
+    try:
+        mosaic(input_dir, output_path)
+        console().print(f"[green]Mosaic created -> {output_path}[/green]")
+    except Exception as exc:
+        handle_error(exc)
+
+
+# ---------------------------------------------------------------------------
+# sudapy raster hillshade
+# ---------------------------------------------------------------------------
+
+@app.command("hillshade")
+def raster_hillshade(
+    input_path: Path = typer.Option(..., "--in", help="Input DEM raster."),
+    output_path: Path = typer.Option(..., "--out", help="Output hillshade raster."),
+    azimuth: float = typer.Option(315.0, "--azimuth", help="Sun azimuth in degrees."),
+    altitude: float = typer.Option(45.0, "--altitude", help="Sun altitude in degrees."),
+) -> None:
+    """Generate a hillshade from a DEM."""
+    from sudapy.raster.ops import hillshade
+
+    try:
+        hillshade(input_path, output_path, azimuth=azimuth, altitude=altitude)
+        console().print(f"[green]Hillshade -> {output_path}[/green]")
+    except Exception as exc:
+        handle_error(exc)
+
+
+# ---------------------------------------------------------------------------
+# sudapy raster slope
+# ---------------------------------------------------------------------------
+
+@app.command("slope")
+def raster_slope(
+    input_path: Path = typer.Option(..., "--in", help="Input DEM raster."),
+    output_path: Path = typer.Option(..., "--out", help="Output slope raster (degrees)."),
+) -> None:
+    """Calculate slope in degrees from a DEM."""
+    from sudapy.raster.ops import slope
+
+    try:
+        slope(input_path, output_path)
+        console().print(f"[green]Slope -> {output_path}[/green]")
+    except Exception as exc:
+        handle_error(exc)
@@ -0,0 +1,95 @@
+"""Remote sensing commands (``sudapy rs ...``)."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import typer
+
+from sudapy.cli._common import FORMAT_HELP, OutputFormat, console, handle_error, print_table
+
+app = typer.Typer(help="Remote sensing tools (requires sudapy[rs]).")
+
+
+# ---------------------------------------------------------------------------
+# sudapy rs sentinel-search
+# ---------------------------------------------------------------------------
+
+@app.command("sentinel-search")
+def rs_sentinel_search(
+    lon: float = typer.Option(..., "--lon", help="Center longitude."),
+    lat: float = typer.Option(..., "--lat", help="Center latitude."),
+    start: str = typer.Option(..., "--start", help="Start date (YYYY-MM-DD)."),
+    end: str = typer.Option(..., "--end", help="End date (YYYY-MM-DD)."),
+    platform_name: str = typer.Option("Sentinel-2", "--platform", help="Satellite platform."),
+    max_cloud: int = typer.Option(30, "--max-cloud", help="Max cloud cover percentage."),
+    fmt: OutputFormat = typer.Option(OutputFormat.table, "--format", help=FORMAT_HELP),
+) -> None:
+    """Search for Sentinel satellite scenes (requires sudapy[rs])."""
+    from sudapy.rs.sentinel import search_scenes
+
+    try:
+        results = search_scenes(
+            lon=lon, lat=lat, start_date=start, end_date=end,
+            platform_name=platform_name, max_cloud=max_cloud,
+        )
+        # Machine-readable output gets every scene, untruncated.
+        if fmt is OutputFormat.json:
+            import json
+
+            json.dump(results, sys.stdout, indent=2)
+            sys.stdout.write("\n")
+            return
+        if fmt is OutputFormat.csv:
+            import csv
+
+            writer = csv.DictWriter(
+                sys.stdout, ["uuid", "date", "cloud_cover", "title"],
+                extrasaction="ignore", lineterminator="\n",
+            )
+            writer.writeheader()
+            writer.writerows(results)
+            return
+
+        if not results:
+            console().print("[yellow]No scenes found for the given parameters.[/yellow]")
+            return
+
+        # Full UUIDs in the rows so piped output can feed sentinel-download;
+        # the rich column truncates them for display.
+        print_table(
+            f"Sentinel Scenes ({len(results)} found)",
+            [
+                ("UUID", {"style": "cyan", "max_width": 15, "no_wrap": True,
+                          "overflow": "ellipsis"}),
+                ("Date", {"style": "green"}),
+                ("Cloud %", {}),
+                ("Title", {}),
+            ],
+            [
+                [r["uuid"], r["date"], f"{r['cloud_cover']:.1f}", r["title"]]
+                for r in results[:20]  # Show top 20
+            ],
+        )
+    except Exception as exc:
+        handle_error(exc)
+
+
+# ---------------------------------------------------------------------------
+# sudapy rs sentinel-download
+# ---------------------------------------------------------------------------
+
+@app.command("sentinel-download")
+def rs_sentinel_download(
+    uuid: str = typer.Option(..., "--uuid", help="Scene UUID from sentinel-search."),
+    out_dir: Path = typer.Option(".", "--out", help="Output directory."),
+) -> None:
+    """Download a Sentinel scene by UUID (requires sudapy[rs])."""
+    from sudapy.rs.sentinel import download_scene
+
+    try:
+        path = download_scene(uuid=uuid, out_dir=out_dir)
+        console().print(f"[green]Downloaded -> {path}[/green]")
+    except Exception as exc:
+        handle_error(exc)
@@ -0,0 +1,150 @@
+"""Vector geoprocessing commands (``sudapy vector ...``)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import typer
+
+from sudapy.cli._common import console, handle_error
+
+app = typer.Typer(help="Vector geoprocessing operations.")
+
+
+# ---------------------------------------------------------------------------
+# sudapy vector reproject
+# ---------------------------------------------------------------------------
+
+@app.command("reproject")
+def vector_reproject(
+    input_path: Path = typer.Option(..., "--in", help="Input vector file."),
+    output_path: Path = typer.Option(..., "--out", help="Output vector file."),
+    to: int = typer.Option(..., "--to", help="Target EPSG code."),
+) -> None:
+    """Reproject a vector dataset to a new CRS."""
+    from sudapy.vector.ops import reproject
+
+    try:
+        reproject(input_path, to_epsg=to, out=output_path)
+        console().print(f"[green]Reprojected to EPSG:{to} -> {output_path}[/green]")
+    except Exception as exc:
+        handle_error(exc)
+
+
+# ---------------------------------------------------------------------------
+# sudapy vector clip
+# ---------------------------------------------------------------------------
+
+@app.command("clip")
+def vector_clip(
+    input_path: Path = typer.Option(..., "--in", help="Input vector file."),
+    clip_path: Path = typer.Option(..., "--clip", help="Clipping geometry file."),
+    output_path: Path = typer.Option(..., "--out", help="Output vector file."),
+) -> None:
+    """Clip a vector dataset by another geometry."""
+    from sudapy.vector.ops import clip
+
+    try:
+        clip(input_path, clip_path, out=output_path)
+        console().print(f"[green]Clipped -> {output_path}[/green]")
+    except Exception as exc:
+        handle_error(exc)
+
+
+# ---------------------------------------------------------------------------
+# sudapy vector dissolve
+# ---------------------------------------------------------------------------
+
+@app.command("dissolve")
+def vector_dissolve(
+    input_path: Path = typer.Option(..., "--in", help="Input vector file."),
+    by: str = typer.Option(..., "--by", help="Field name to dissolve on."),
+    output_path: Path = typer.Option(..., "--out", help="Output vector file."),
+) -> None:
+    """Dissolve geometries by an attribute field."""
+    from sudapy.vector.ops import dissolve
+
+    try:
+        dissolve(input_path, by=by, out=output_path)
+        console().print(f"[green]Dissolved by '{by}' -> {output_path}[/green]")
+    except Exception as exc:
+        handle_error(exc)
+
+
+# ---------------------------------------------------------------------------
+# sudapy vector area
+# ---------------------------------------------------------------------------
+
+@app.command("area")
+def vector_area(
+    input_path: Path = typer.Option(..., "--in", help="Input vector file."),
+    field: str = typer.Option("area_m2", "--field", help="Name for the new area column."),
+    output_path: Path = typer.Option(..., "--out", help="Output vector file."),
+) -> None:
+    """Calculate geometry area in square meters."""
+    from sudapy.vector.ops import calculate_area
+
+    try:
+        calculate_area(input_path, field=field, out=output_path)
+        console().print(f"[green]Area calculated (column '{field}') -> {output_path}[/green]")
+    except Exception as exc:
+        handle_error(exc)
+
+
+# ---------------------------------------------------------------------------
+# sudapy vector buffer
+# ---------------------------------------------------------------------------
+
+@app.command("buffer")
+def vector_buffer(
+    input_path: Path = typer.Option(..., "--in", help="Input vector file."),
+    distance: float = typer.Option(..., "--distance", help="Buffer distance in meters."),
+    output_path: Path = typer.Option(..., "--out", help="Output vector file."),
+) -> None:
+    """Buffer geometries by a distance in meters."""
+    from sudapy.vector.ops import buffer
+
+    try:
+        buffer(input_path, distance_m=distance, out=output_path)
+        console().print(f"[green]Buffered by {distance}m -> {output_path}[/green]")
+    except Exception as exc:
+        handle_error(exc)
+
+
+# ---------------------------------------------------------------------------
+# sudapy vector simplify
+# ---------------------------------------------------------------------------
+
+@app.command("simplify")
+def vector_simplify(
+    input_path: Path = typer.Option(..., "--in", help="Input vector file."),
+    tolerance: float = typer.Option(..., "--tolerance", help="Simplification tolerance in meters."),
+    output_path: Path = typer.Option(..., "--out", help="Output vector file."),
+) -> None:
+    """Simplify geometries to reduce vertex count."""
+    from sudapy.vector.ops import simplify
+
+    try:
+        simplify(input_path, tolerance_m=tolerance, out=output_path)
+        console().print(f"[green]Simplified (tolerance={tolerance}m) -> {output_path}[/green]")
+    except Exception as exc:
+        handle_error(exc)
+
+
+# ---------------------------------------------------------------------------
+# sudapy vector fix-geometry
+# ---------------------------------------------------------------------------
+
+@app.command("fix-geometry")
+def vector_fix_geometry(
+    input_path: Path = typer.Option(..., "--in", help="Input vector file."),
+    output_path: Path = typer.Option(..., "--out", help="Output vector file."),
+) -> None:
+    """Repair invalid geometries using make_valid."""
+    from sudapy.vector.ops import fix_geometry
+
+    try:
+        fix_geometry(input_path, out=output_path)
+        console().print(f"[green]Geometries fixed -> {output_path}[/green]")
+    except Exception as exc:
+        handle_error(exc)
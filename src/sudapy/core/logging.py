@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 
 from rich.console import Console
@@ -10,11 +11,37 @@ from rich.logging import RichHandler
 console = Console(stderr=True)
 
 _LOG_FORMAT = "%(message)s"
+_ROOT_LOGGER = "sudapy"
 
 
+@functools.cache
+def _rich_handler() -> RichHandler:
+    """Return the single Rich handler shared by every SudaPy logger."""
+    handler = RichHandler(
+        console=console,
+        show_time=False,
+        show_path=False,
+        markup=True,
+    )
+    handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    return handler
+
+
+def _attach_handler(logger: logging.Logger) -> None:
+    handler = _rich_handler()
+    if handler not in logger.handlers:
+        logger.addHandler(handler)
+
+
+@functools.cache
 def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     """Return a configured logger with Rich handler.
 
+    Loggers inside the ``sudapy`` package get no handler of their own: the
+    shared Rich handler sits on the ``sudapy`` logger and records propagate
+    to it. Other names get the shared handler attached directly. Results
+    are cached per ``(name, level)``.
+
     Args:
         name: Logger name (typically ``__name__``).
         level: Logging level.
@@ -23,15 +50,10 @@ def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
         Configured :class:`logging.Logger`.
     """
     logger = logging.getLogger(name)
-    if not logger.handlers:
-        handler = RichHandler(
-            console=console,
-            show_time=False,
-            show_path=False,
-            markup=True,
-        )
-        handler.setFormatter(logging.Formatter(_LOG_FORMAT))
-        logger.addHandler(handler)
+    if name == _ROOT_LOGGER or name.startswith(_ROOT_LOGGER + "."):
+        _attach_handler(logging.getLogger(_ROOT_LOGGER))
+    else:
+        _attach_handler(logger)
     logger.setLevel(level)
     return logger
 
@@ -43,14 +65,6 @@ def setup_logging(verbose: bool = False) -> None:
         verbose: If ``True``, set level to DEBUG.
     """
     level = logging.DEBUG if verbose else logging.INFO
-    root = logging.getLogger("sudapy")
+    root = logging.getLogger(_ROOT_LOGGER)
     root.setLevel(level)
-    if not root.handlers:
-        handler = RichHandler(
-            console=console,
-            show_time=False,
-            show_path=False,
-            markup=True,
-        )
-        handler.setFormatter(logging.Formatter(_LOG_FORMAT))
-        root.addHandler(handler)
+    _attach_handler(root)
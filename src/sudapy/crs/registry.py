@@ -6,10 +6,15 @@ plus a helper to suggest the appropriate UTM zone for a given coordinate.
 
 from __future__ import annotations
 
+import functools
 import math
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from pyproj import CRS
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike
+    from pyproj import CRS
 
 
 @dataclass(frozen=True)
@@ -26,7 +31,7 @@ class CRSPreset:
 # Built-in presets
 # ---------------------------------------------------------------------------
 
-SUDAN_CRS_PRESETS: list[CRSPreset] = [
+SUDAN_CRS_PRESETS: tuple[CRSPreset, ...] = (
     CRSPreset(
         epsg=4326,
         name="WGS 84",
@@ -75,20 +80,40 @@ SUDAN_CRS_PRESETS: list[CRSPreset] = [
         description="Legacy Adindan datum, UTM zone 37N",
         region="Red Sea / Far-Eastern Sudan (legacy surveys)",
     ),
-]
+)
 
+_PRESETS_BY_EPSG: dict[int, CRSPreset] = {p.epsg: p for p in SUDAN_CRS_PRESETS}
 
-def list_presets() -> list[CRSPreset]:
-    """Return all built-in Sudan CRS presets."""
-    return list(SUDAN_CRS_PRESETS)
+
+def list_presets() -> tuple[CRSPreset, ...]:
+    """Return all built-in Sudan CRS presets.
+
+    The registry tuple itself is returned, not a copy; call ``list()`` on it
+    if you need a mutable sequence.
+    """
+    return SUDAN_CRS_PRESETS
 
 
 def get_preset(epsg: int) -> CRSPreset | None:
     """Lookup a preset by EPSG code. Returns ``None`` if not found."""
-    for p in SUDAN_CRS_PRESETS:
-        if p.epsg == epsg:
-            return p
-    return None
+    return _PRESETS_BY_EPSG.get(epsg)
+
+
+# UTM zone names, indexed by zone number - 1, so suggestions do not format
+# a string per call.
+_UTM_NAMES_N = tuple(f"WGS 84 / UTM zone {z}N" for z in range(1, 61))
+_UTM_NAMES_S = tuple(f"WGS 84 / UTM zone {z}S" for z in range(1, 61))
+
+# UTM zones of secondary (non-WGS 84) datums that suggest_utm_zone() offers
+# alongside the WGS 84 code: (datum, hemisphere, zone) -> preset EPSG. The
+# suggestion name is the preset's, so every code here must be a preset.
+# Lookups are O(1) however many datums and zones are registered.
+_DATUM_ZONE_EPSG: dict[tuple[str, str, int], int] = {
+    ("Adindan", "N", 35): 20135,
+    ("Adindan", "N", 36): 20136,
+    ("Adindan", "N", 37): 20137,
+}
+_SECONDARY_DATUMS = tuple(dict.fromkeys(datum for datum, _, _ in _DATUM_ZONE_EPSG))
 
 
 def suggest_utm_zone(lon: float, lat: float) -> list[dict]:
@@ -106,38 +131,86 @@ def suggest_utm_zone(lon: float, lat: float) -> list[dict]:
     if not (-90 <= lat <= 90):
         raise ValueError(f"Latitude {lat} out of range [-90, 90]")
 
-    zone_number = int(math.floor((lon + 180) / 6)) + 1
+    # lon == 180 belongs to zone 60, not a 61st zone.
+    zone_number = min(int(math.floor((lon + 180) / 6)) + 1, 60)
     hemisphere = "N" if lat >= 0 else "S"
 
     base_epsg = 32600 if hemisphere == "N" else 32700
     wgs84_epsg = base_epsg + zone_number
+    names = _UTM_NAMES_N if hemisphere == "N" else _UTM_NAMES_S
 
     suggestions: list[dict] = [
         {
             "epsg": wgs84_epsg,
             "zone": zone_number,
             "hemisphere": hemisphere,
-            "name": f"WGS 84 / UTM zone {zone_number}{hemisphere}",
+            "name": names[zone_number - 1],
             "datum": "WGS 84",
         },
     ]
 
-    # If the point falls in a zone covered by Adindan presets, suggest those too.
-    adindan_map = {35: 20135, 36: 20136, 37: 20137}
-    if zone_number in adindan_map and hemisphere == "N":
-        suggestions.append(
-            {
-                "epsg": adindan_map[zone_number],
-                "zone": zone_number,
-                "hemisphere": hemisphere,
-                "name": f"Adindan / UTM zone {zone_number}N",
-                "datum": "Adindan",
-            }
-        )
+    # If the zone is covered by a secondary-datum preset, suggest that too.
+    for datum in _SECONDARY_DATUMS:
+        epsg = _DATUM_ZONE_EPSG.get((datum, hemisphere, zone_number))
+        if epsg is not None:
+            suggestions.append(
+                {
+                    "epsg": epsg,
+                    "zone": zone_number,
+                    "hemisphere": hemisphere,
+                    "name": _PRESETS_BY_EPSG[epsg].name,
+                    "datum": datum,
+                }
+            )
 
     return suggestions
 
 
+def suggest_utm_zone_batch(lon: ArrayLike, lat: ArrayLike) -> np.ndarray:
+    """Return the WGS 84 UTM EPSG code for every point in one vectorised pass.
+
+    The bulk counterpart of :func:`suggest_utm_zone`: it computes the same
+    WGS 84 code but skips the per-point dicts, names and Adindan
+    alternatives, so it suits preflight checks over many GPS points.
+
+    Args:
+        lon: Longitudes in decimal degrees (any array-like).
+        lat: Latitudes in decimal degrees, broadcastable against *lon*.
+
+    Returns:
+        An ``int32`` array of EPSG codes (326xx north, 327xx south).
+
+    Raises:
+        ValueError: If any coordinate is out of range.
+    """
+    import numpy as np
+
+    lon = np.asarray(lon, dtype=np.float64)
+    lat = np.asarray(lat, dtype=np.float64)
+    if ((lon < -180) | (lon > 180)).any():
+        raise ValueError("Longitude values out of range [-180, 180]")
+    if ((lat < -90) | (lat > 90)).any():
+        raise ValueError("Latitude values out of range [-90, 90]")
+
+    zone = np.minimum(np.floor((lon + 180.0) / 6.0).astype(np.int32) + 1, 60)
+    base = np.where(lat >= 0, 32600, 32700).astype(np.int32)
+    return base + zone
+
+
+@functools.lru_cache(maxsize=256)
+def _crs_from_epsg(epsg: int) -> CRS:
+    """Build (once per code) the :class:`pyproj.CRS` for *epsg*.
+
+    ``lru_cache`` does not store exceptions, so invalid codes are never
+    cached and keep raising.
+    """
+    # pyproj is imported here, not at module level: listing presets and
+    # suggesting UTM zones are pure Python and should not pay for PROJ.
+    from pyproj import CRS
+
+    return CRS.from_epsg(epsg)
+
+
 def validate_epsg(epsg: int) -> CRS:
     """Return a :class:`pyproj.CRS` for the given EPSG code or raise.
 
@@ -145,7 +218,8 @@ def validate_epsg(epsg: int) -> CRS:
         epsg: EPSG code.
 
     Returns:
-        A ``pyproj.CRS`` instance.
+        A ``pyproj.CRS`` instance. Repeated calls with the same code return
+        the same cached object.
 
     Raises:
         sudapy.core.errors.CRSError: If the EPSG code is invalid.
@@ -153,9 +227,22 @@ def validate_epsg(epsg: int) -> CRS:
     from sudapy.core.errors import CRSError
 
     try:
-        return CRS.from_epsg(epsg)
+        return _crs_from_epsg(epsg)
     except Exception as exc:
         raise CRSError(
             f"Invalid EPSG code: {epsg}",
             hint="Use 'sudapy crs list' to see common Sudan CRS presets.",
         ) from exc
+
+
+@functools.lru_cache(maxsize=64)
+def _crs_equals(a_wkt: str, b_wkt: str) -> bool:
+    """Return whether two CRS definitions (as WKT) describe the same CRS.
+
+    Axis order is ignored: GeoPandas and rasterio both keep coordinates in
+    x/y (lon/lat) order, so ``EPSG:4326`` and ``OGC:CRS84`` need no
+    transformation between them. Results are cached per WKT pair.
+    """
+    from pyproj import CRS
+
+    return CRS.from_wkt(a_wkt).equals(CRS.from_wkt(b_wkt), ignore_axis_order=True)
@@ -0,0 +1,130 @@
+"""Terrain kernels behind :func:`sudapy.raster.ops.hillshade` and ``slope``.
+
+When :mod:`numba` is installed (``pip install "sudapy[fast]"``) gradient,
+slope, aspect and illumination are computed in one fused, parallel loop per
+cell, writing straight into a ``float32`` output. Otherwise the NumPy
+implementation is used. Both follow :func:`numpy.gradient` exactly:
+central differences inside, first-order one-sided differences on the edges.
+"""
+
+from __future__ import annotations
+
+import math
+
+try:
+    import numba
+except ImportError:  # optional accelerator
+    numba = None
+
+prange = numba.prange if numba is not None else range
+
+
+# ---------------------------------------------------------------------------
+# Fused per-cell kernels (plain Python; JIT-compiled below when possible)
+# ---------------------------------------------------------------------------
+
+def _slope_kernel(dem, dx, dy, out):
+    h, w = dem.shape
+    for i in prange(h):
+        i0 = i - 1 if i > 0 else 0
+        i1 = i + 1 if i < h - 1 else h - 1
+        sy = (i1 - i0) * dy
+        for j in range(w):
+            j0 = j - 1 if j > 0 else 0
+            j1 = j + 1 if j < w - 1 else w - 1
+            gx = (dem[i, j1] - dem[i, j0]) / ((j1 - j0) * dx)
+            gy = (dem[i1, j] - dem[i0, j]) / sy
+            out[i, j] = math.degrees(math.atan(math.sqrt(gx * gx + gy * gy)))
+
+
+def _hillshade_kernel(dem, dx, dy, az_rad, alt_rad, out):
+    h, w = dem.shape
+    sin_alt = math.sin(alt_rad)
+    cos_alt = math.cos(alt_rad)
+    for i in prange(h):
+        i0 = i - 1 if i > 0 else 0
+        i1 = i + 1 if i < h - 1 else h - 1
+        sy = (i1 - i0) * dy
+        for j in range(w):
+            j0 = j - 1 if j > 0 else 0
+            j1 = j + 1 if j < w - 1 else w - 1
+            gx = (dem[i, j1] - dem[i, j0]) / ((j1 - j0) * dx)
+            gy = (dem[i1, j] - dem[i0, j]) / sy
+            slope = math.atan(math.sqrt(gx * gx + gy * gy))
+            aspect = math.atan2(-gy, gx)
+            v = sin_alt * math.cos(slope) + cos_alt * math.sin(slope) * math.cos(az_rad - aspect)
+            # Same as np.clip(v, 0, 1) * 255, NaN (nodata) included.
+            out[i, j] = 0.0 if v < 0.0 else (255.0 if v > 1.0 else v * 255.0)
+
+
+if numba is not None:
+    # No fastmath: it assumes NaN-free input, and DEM nodata is often NaN.
+    _slope_jit = numba.njit(parallel=True, cache=True)(_slope_kernel)
+    _hillshade_jit = numba.njit(parallel=True, cache=True)(_hillshade_kernel)
+
+
+# ---------------------------------------------------------------------------
+# Public entry points
+# ---------------------------------------------------------------------------
+
+def compute_slope(dem, dx: float, dy: float):
+    """Return slope in degrees as a ``float32`` array shaped like *dem*."""
+    import numpy as np
+
+    if numba is not None and min(dem.shape) >= 2:
+        out = np.empty(dem.shape, dtype=np.float32)
+        _slope_jit(dem, float(dx), float(dy), out)
+        return out
+
+    # Work in the gradient buffers instead of allocating a temporary per step.
+    grad_y, grad_x = np.gradient(dem, dy, dx)
+    slope = np.multiply(grad_x, grad_x, out=grad_x)
+    slope += np.multiply(grad_y, grad_y, out=grad_y)
+    np.sqrt(slope, out=slope)
+    np.arctan(slope, out=slope)
+    return np.degrees(slope, out=_float32_out(slope))
+
+
+def compute_hillshade(dem, dx: float, dy: float, azimuth: float, altitude: float):
+    """Return hillshade illumination (0-255) as a ``float32`` array."""
+    import numpy as np
+
+    az_rad = math.radians(360.0 - azimuth + 90.0)
+    alt_rad = math.radians(altitude)
+
+    if numba is not None and min(dem.shape) >= 2:
+        out = np.empty(dem.shape, dtype=np.float32)
+        _hillshade_jit(dem, float(dx), float(dy), az_rad, alt_rad, out)
+        return out
+
+    # hs = sin(alt)·cos(slope) + cos(alt)·sin(slope)·cos(az − aspect),
+    # clipped to [0, 1] and scaled to 0-255, reusing the gradient buffers.
+    grad_y, grad_x = np.gradient(dem, dy, dx)
+    slope = grad_x * grad_x
+    slope += grad_y * grad_y
+    np.sqrt(slope, out=slope)
+    np.arctan(slope, out=slope)
+    aspect = np.arctan2(np.negative(grad_y, out=grad_y), grad_x, out=grad_x)
+
+    shade = np.subtract(az_rad, aspect, out=aspect)
+    np.cos(shade, out=shade)
+    shade *= np.sin(slope, out=grad_y)
+    shade *= math.cos(alt_rad)
+
+    hs = np.cos(slope, out=slope)
+    hs *= math.sin(alt_rad)
+    hs += shade
+    np.clip(hs, 0, 1, out=hs)
+    return np.multiply(hs, 255.0, out=_float32_out(hs))
+
+
+def _float32_out(arr):
+    """Return *arr* itself if it is ``float32``, else an empty ``float32`` twin.
+
+    The last step of each NumPy path writes straight into this buffer, so a
+    float64 intermediate is narrowed in the same pass instead of by a
+    separate ``astype`` copy.
+    """
+    import numpy as np
+
+    return arr if arr.dtype == np.float32 else np.empty(arr.shape, dtype=np.float32)
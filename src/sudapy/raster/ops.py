@@ -6,12 +6,15 @@ capabilities: clip, reproject, resample, mosaic, hillshade, and slope.
 
 from __future__ import annotations
 
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Union
 
 from sudapy.core.errors import FileFormatError, SudaPyError, require_extra
 from sudapy.core.logging import get_logger
-from sudapy.crs.registry import validate_epsg
+from sudapy.crs.registry import _crs_equals, validate_epsg
 
 logger = get_logger(__name__)
 
@@ -19,6 +22,25 @@ PathLike = Union[str, Path]
 
 _RASTER_EXTS = {".tif", ".tiff", ".img", ".vrt"}
 
+# Creation options shared by every GeoTIFF this module writes: tiled,
+# ZSTD-compressed, BigTIFF when the output could exceed 4 GB, and
+# compressed with all cores. The predictor depends on the data type and is
+# added by _gtiff_profile().
+_GTIFF_PROFILE = {
+    "driver": "GTiff",
+    "tiled": True,
+    "blockxsize": 512,
+    "blockysize": 512,
+    "compress": "zstd",
+    "BIGTIFF": "IF_SAFER",
+    "num_threads": "ALL_CPUS",
+}
+
+# Working memory for each reproject warp, in MB (GDAL's default is 64). The
+# warp streams through the band in chunks of this size, so peak memory stays
+# bounded however large the scene is.
+_WARP_MEM_LIMIT_MB = 256
+
 
 def clip(
     src: PathLike,
@@ -53,7 +75,9 @@ def clip(
     mask_gdf = read_vector(clip_vector)
 
     with rasterio.open(src) as ds:
-        if mask_gdf.crs and mask_gdf.crs != ds.crs:
+        if mask_gdf.crs and (
+            ds.crs is None or not _crs_equals(mask_gdf.crs.to_wkt(), ds.crs.to_wkt())
+        ):
             logger.info("Reprojecting clip vector to raster CRS (%s)", ds.crs)
             mask_gdf = mask_gdf.to_crs(ds.crs)
 
@@ -65,7 +89,7 @@ def clip(
         )
         out_meta = ds.meta.copy()
         out_meta.update({
-            "driver": "GTiff",
+            **_gtiff_profile(out_image.dtype),
             "height": out_image.shape[1],
             "width": out_image.shape[2],
             "transform": out_transform,
@@ -93,26 +117,17 @@ def reproject_raster(
         src: Input raster path.
         out: Output raster path.
         to_epsg: Target EPSG code.
-        resampling: Resampling method name: ``nearest``, ``bilinear``, ``cubic``.
+        resampling: Resampling method name: ``nearest``, ``bilinear``, ``cubic``,
+            ``lanczos``, or ``average``.
 
     Returns:
         Path to the output raster.
     """
     rasterio = require_extra("rasterio", "geo")
-    from rasterio.warp import Resampling, calculate_default_transform
+    from rasterio.warp import calculate_default_transform
     from rasterio.warp import reproject as rio_reproject
 
-    _resampling_map = {
-        "nearest": Resampling.nearest,
-        "bilinear": Resampling.bilinear,
-        "cubic": Resampling.cubic,
-    }
-    resampling_method = _resampling_map.get(resampling)
-    if resampling_method is None:
-        raise SudaPyError(
-            f"Unknown resampling method '{resampling}'",
-            hint=f"Supported: {', '.join(_resampling_map.keys())}",
-        )
+    resampling_method = _get_resampling(resampling)
 
     src = Path(src)
     out = Path(out)
@@ -131,9 +146,15 @@ def reproject_raster(
             "transform": transform,
             "width": width,
             "height": height,
-            "driver": "GTiff",
+            **_gtiff_profile(ds.dtypes[0]),
         })
 
+        # Warp band-to-band so GDAL streams each band through its warp
+        # buffer in chunks (bounded by warp_mem_limit) instead of holding a
+        # whole band in memory; GDAL's own warp threads supply the
+        # parallelism.
+        warp_threads = os.cpu_count() or 1
+
         out.parent.mkdir(parents=True, exist_ok=True)
         with rasterio.open(out, "w", **kwargs) as dst:
             for i in range(1, ds.count + 1):
@@ -144,7 +165,10 @@ def reproject_raster(
                     src_crs=ds.crs,
                     dst_transform=transform,
                     dst_crs=dst_crs,
+                    dst_nodata=ds.nodata,
                     resampling=resampling_method,
+                    num_threads=warp_threads,
+                    warp_mem_limit=_WARP_MEM_LIMIT_MB,
                 )
 
     logger.info("Reprojected raster written to %s", out)
@@ -163,31 +187,20 @@ def resample(
         src: Input raster path.
         out: Output raster path.
         scale_factor: Factor to scale resolution (2.0 = double resolution).
-        method: Resampling method name: ``nearest``, ``bilinear``, ``cubic``.
+        method: Resampling method name: ``nearest``, ``bilinear``, ``cubic``,
+            ``lanczos``, or ``average``.
 
     Returns:
         Path to the output raster.
     """
     rasterio = require_extra("rasterio", "geo")
-    from rasterio.warp import Resampling
-
-    _resampling_map = {
-        "nearest": Resampling.nearest,
-        "bilinear": Resampling.bilinear,
-        "cubic": Resampling.cubic,
-    }
 
     src = Path(src)
     out = Path(out)
     if not src.exists():
         raise FileFormatError(f"Raster not found: {src}")
 
-    resampling_method = _resampling_map.get(method)
-    if resampling_method is None:
-        raise SudaPyError(
-            f"Unknown resampling method '{method}'",
-            hint=f"Supported: {', '.join(_resampling_map.keys())}",
-        )
+    resampling_method = _get_resampling(method)
 
     with rasterio.open(src) as ds:
         new_height = int(ds.height * scale_factor)
@@ -205,7 +218,7 @@ def resample(
 
         kwargs = ds.meta.copy()
         kwargs.update({
-            "driver": "GTiff",
+            **_gtiff_profile(data.dtype),
             "height": new_height,
             "width": new_width,
             "transform": transform,
@@ -240,34 +253,35 @@ def mosaic(
     rasterio = require_extra("rasterio", "geo")
     from rasterio.merge import merge as rio_merge
 
-    raster_files = sorted(
-        f for f in src_dir.iterdir() if f.suffix.lower() in _RASTER_EXTS
-    )
+    # The extension test runs on the directory entry's name, so Path objects
+    # (and the is_file() check, cached by scandir) are only paid for matches.
+    with os.scandir(src_dir) as it:
+        raster_files = sorted(
+            Path(e.path) for e in it
+            if os.path.splitext(e.name)[1].lower() in _RASTER_EXTS and e.is_file()
+        )
     if not raster_files:
         raise FileFormatError(
             f"No raster files found in {src_dir}",
             hint=f"Supported extensions: {', '.join(_RASTER_EXTS)}",
         )
 
-    datasets = [rasterio.open(f) for f in raster_files]
+    datasets = _open_all(rasterio, raster_files)
     try:
-        mosaic_data, mosaic_transform = rio_merge(datasets)
+        # With dst_path, merge() writes the mosaic straight to disk. From
+        # rasterio 1.4 it does so in chunks bounded by mem_limit; 1.3 still
+        # builds the whole array in memory first. The merged raster takes
+        # the first tile's data type, which picks the predictor.
+        out.parent.mkdir(parents=True, exist_ok=True)
+        rio_merge(
+            datasets,
+            dst_path=str(out),
+            dst_kwds=_gtiff_profile(datasets[0].dtypes[0]),
+        )
     finally:
         for ds in datasets:
             ds.close()
 
-    kwargs = datasets[0].meta.copy()
-    kwargs.update({
-        "driver": "GTiff",
-        "height": mosaic_data.shape[1],
-        "width": mosaic_data.shape[2],
-        "transform": mosaic_transform,
-    })
-
-    out.parent.mkdir(parents=True, exist_ok=True)
-    with rasterio.open(out, "w", **kwargs) as dst:
-        dst.write(mosaic_data)
-
     logger.info("Mosaic of %d tiles written to %s", len(raster_files), out)
     return out
 
@@ -291,7 +305,8 @@ def hillshade(
         Path to the hillshade raster.
     """
     rasterio = require_extra("rasterio", "geo")
-    np = require_extra("numpy", "geo")
+    require_extra("numpy", "geo")
+    from sudapy.raster import _terrain
 
     src = Path(src)
     out = Path(out)
@@ -299,22 +314,13 @@ def hillshade(
         raise FileFormatError(f"Raster not found: {src}")
 
     with rasterio.open(src) as ds:
-        dem = ds.read(1).astype(np.float64)
         cellsize_x = abs(ds.transform.a)
         cellsize_y = abs(ds.transform.e)
 
-        hs = _compute_hillshade(dem, cellsize_x, cellsize_y, azimuth, altitude)
-
-        kwargs = ds.meta.copy()
-        kwargs.update({
-            "driver": "GTiff",
-            "dtype": "float32",
-            "count": 1,
-        })
+        def _tile(dem):
+            return _terrain.compute_hillshade(dem, cellsize_x, cellsize_y, azimuth, altitude)
 
-    out.parent.mkdir(parents=True, exist_ok=True)
-    with rasterio.open(out, "w", **kwargs) as dst:
-        dst.write(hs.astype(np.float32), 1)
+        _write_terrain(rasterio, ds, out, _tile)
 
     logger.info("Hillshade written to %s", out)
     return out
@@ -334,7 +340,8 @@ def slope(
         Path to the slope raster.
     """
     rasterio = require_extra("rasterio", "geo")
-    np = require_extra("numpy", "geo")
+    require_extra("numpy", "geo")
+    from sudapy.raster import _terrain
 
     src = Path(src)
     out = Path(out)
@@ -342,60 +349,133 @@ def slope(
         raise FileFormatError(f"Raster not found: {src}")
 
     with rasterio.open(src) as ds:
-        dem = ds.read(1).astype(np.float64)
         cellsize_x = abs(ds.transform.a)
         cellsize_y = abs(ds.transform.e)
 
-        slope_deg = _compute_slope(dem, cellsize_x, cellsize_y)
+        def _tile(dem):
+            return _terrain.compute_slope(dem, cellsize_x, cellsize_y)
 
-        kwargs = ds.meta.copy()
-        kwargs.update({
-            "driver": "GTiff",
-            "dtype": "float32",
-            "count": 1,
-        })
-
-    out.parent.mkdir(parents=True, exist_ok=True)
-    with rasterio.open(out, "w", **kwargs) as dst:
-        dst.write(slope_deg.astype(np.float32), 1)
+        _write_terrain(rasterio, ds, out, _tile)
 
     logger.info("Slope raster written to %s", out)
     return out
 
 
 # ---------------------------------------------------------------------------
-# Internal helpers for terrain analysis
+# Internal helpers
 # ---------------------------------------------------------------------------
 
-def _compute_slope(dem, dx: float, dy: float):
-    """Compute slope in degrees using numpy gradient."""
-    import numpy as np
+@functools.cache
+def _resampling_methods() -> dict:
+    """Map method names to :class:`rasterio.enums.Resampling`, built once."""
+    from rasterio.enums import Resampling
+
+    return {
+        "nearest": Resampling.nearest,
+        "bilinear": Resampling.bilinear,
+        "cubic": Resampling.cubic,
+        "lanczos": Resampling.lanczos,
+        "average": Resampling.average,
+    }
+
+
+def _open_all(rasterio, paths: list[Path]) -> list:
+    """Open *paths* concurrently and return the datasets in the same order.
 
-    grad_y, grad_x = np.gradient(dem, dy, dx)
-    slope_rad = np.arctan(np.sqrt(grad_x**2 + grad_y**2))
-    return np.degrees(slope_rad)
+    Opening parses headers and discovers overviews, which is I/O-bound and
+    releases the GIL, so many tiles open much faster on a thread pool. If
+    any file fails to open, the others are closed and the error re-raised.
+    """
+    with ThreadPoolExecutor(min(32, len(paths))) as pool:
+        futures = [pool.submit(rasterio.open, p) for p in paths]
+
+    datasets = [f.result() for f in futures if f.exception() is None]
+    for future in futures:
+        exc = future.exception()
+        if exc is not None:
+            for ds in datasets:
+                ds.close()
+            raise exc
+    return datasets
+
+
+def _get_resampling(name: str):
+    """Return the Resampling member for *name* or raise :class:`SudaPyError`."""
+    methods = _resampling_methods()
+    method = methods.get(name)
+    if method is None:
+        raise SudaPyError(
+            f"Unknown resampling method '{name}'",
+            hint=f"Supported: {', '.join(methods)}",
+        )
+    return method
 
 
-def _compute_hillshade(
-    dem,
-    dx: float,
-    dy: float,
-    azimuth: float,
-    altitude: float,
-):
-    """Compute hillshade illumination values (0-255)."""
+def _gtiff_profile(dtype) -> dict:
+    """Return the GeoTIFF creation options for an output of *dtype*.
+
+    Floating-point data uses the floating-point predictor (3), integers
+    horizontal differencing (2); anything else is compressed without one.
+    """
     import numpy as np
 
-    az_rad = np.radians(360.0 - azimuth + 90.0)
-    alt_rad = np.radians(altitude)
+    kind = np.dtype(dtype).kind
+    predictor = 3 if kind == "f" else 2 if kind in "iu" else 1
+    return {**_GTIFF_PROFILE, "predictor": predictor}
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers for terrain analysis
+# ---------------------------------------------------------------------------
+
+_TERRAIN_BLOCK = 512
+
+
+def _write_terrain(rasterio, ds, out: Path, compute) -> None:
+    """Apply a terrain kernel to band 1 of *ds* block by block.
+
+    The output is written as a tiled, compressed ``float32`` GeoTIFF. Each output block
+    is computed from the matching DEM window grown by one pixel on every
+    side (clipped to the raster), so interior blocks see their neighbours
+    for the central differences and the raster edges keep the one-sided
+    differences of :func:`numpy.gradient`. Peak memory is a few blocks
+    rather than the whole DEM.
+    """
+    from rasterio.windows import Window
+
+    kwargs = ds.meta.copy()
+    kwargs.update({
+        **_gtiff_profile("float32"),
+        "dtype": "float32",
+        "count": 1,
+        "blockxsize": _TERRAIN_BLOCK,
+        "blockysize": _TERRAIN_BLOCK,
+    })
+
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with rasterio.open(out, "w", **kwargs) as dst:
+        for _, win in dst.block_windows(1):
+            row0 = max(win.row_off - 1, 0)
+            col0 = max(win.col_off - 1, 0)
+            row1 = min(win.row_off + win.height + 1, ds.height)
+            col1 = min(win.col_off + win.width + 1, ds.width)
+
+            dem = _read_dem(ds, Window(col0, row0, col1 - col0, row1 - row0))
+            result = compute(dem)
+
+            r = win.row_off - row0
+            c = win.col_off - col0
+            dst.write(result[r:r + win.height, c:c + win.width], 1, window=win)
 
-    grad_y, grad_x = np.gradient(dem, dy, dx)
-    slope_rad = np.arctan(np.sqrt(grad_x**2 + grad_y**2))
-    aspect_rad = np.arctan2(-grad_y, grad_x)
 
-    hs = (
-        np.sin(alt_rad) * np.cos(slope_rad)
-        + np.cos(alt_rad) * np.sin(slope_rad) * np.cos(az_rad - aspect_rad)
-    )
-    hs = np.clip(hs, 0, 1) * 255.0
-    return hs
+def _read_dem(ds, window=None):
+    """Read band 1 (or a *window* of it) as ``float32``.
+
+    Single precision resolves elevations to well under a millimetre at any
+    terrestrial height, and the outputs are written as ``float32`` anyway;
+    computing in float64 would only double the memory the terrain kernels
+    stream through.
+    """
+    import numpy as np
+
+    return ds.read(1, window=window).astype(np.float32, copy=False)
@@ -12,7 +12,9 @@ Register at https://scihub.copernicus.eu/dhus/#/self-registration
 
 from __future__ import annotations
 
+import functools
 import os
+from operator import itemgetter
 from pathlib import Path
 from typing import Union
 
@@ -27,9 +29,13 @@ _HUB_URL = "https://apihub.copernicus.eu/apihub"
 
 
 def _get_api():
-    """Return a configured SentinelAPI instance."""
+    """Return a configured SentinelAPI instance.
+
+    The instance is reused for as long as the credentials in the environment
+    stay the same, so repeated searches and downloads share one HTTP session.
+    """
     try:
-        from sentinelsat import SentinelAPI
+        import sentinelsat  # noqa: F401
     except ImportError as exc:
         raise DependencyError(
             "sentinelsat is required for Sentinel operations.",
@@ -48,7 +54,14 @@ def _get_api():
             ),
         )
 
-    return SentinelAPI(user, password, _HUB_URL)
+    return _connect(user, password, _HUB_URL)
+
+
+@functools.lru_cache(maxsize=4)
+def _connect(user: str, password: str, url: str):
+    from sentinelsat import SentinelAPI
+
+    return SentinelAPI(user, password, url)
 
 
 def search_scenes(
@@ -59,6 +72,7 @@ def search_scenes(
     end_date: str,
     platform_name: str = "Sentinel-2",
     max_cloud: int = 30,
+    cache: bool = True,
 ) -> list[dict]:
     """Search for Sentinel scenes around a point.
 
@@ -69,34 +83,56 @@ def search_scenes(
         end_date: End date as YYYY-MM-DD.
         platform_name: Satellite platform (default ``Sentinel-2``).
         max_cloud: Maximum cloud cover percentage (default 30).
+        cache: Reuse the results of an identical earlier query in this
+            process instead of asking the hub again (default ``True``).
 
     Returns:
         List of dicts with keys: ``uuid``, ``title``, ``date``, ``cloud_cover``.
     """
-    api = _get_api()
+    query = (
+        f"POINT({lon} {lat})",
+        start_date.replace("-", ""),
+        end_date.replace("-", ""),
+        platform_name,
+        max_cloud,
+    )
+    # Cached scenes are copied so callers cannot modify the cache entries.
+    results = [dict(r) for r in _query_cached(*query)] if cache else _query(*query)
 
-    # Create a small point footprint
-    footprint = f"POINT({lon} {lat})"
+    logger.info("Found %d scenes", len(results))
+    return results
+
+
+@functools.lru_cache(maxsize=128)
+def _query_cached(
+    footprint: str, start: str, end: str, platform_name: str, max_cloud: int,
+) -> tuple[dict, ...]:
+    return tuple(_query(footprint, start, end, platform_name, max_cloud))
 
-    products = api.query(
+
+def _query(
+    footprint: str, start: str, end: str, platform_name: str, max_cloud: int,
+) -> list[dict]:
+    """Run one hub query and return the scenes, newest first."""
+    products = _get_api().query(
         footprint,
-        date=(start_date.replace("-", ""), end_date.replace("-", "")),
+        date=(start, end),
         platformname=platform_name,
         cloudcoverpercentage=(0, max_cloud),
     )
 
-    results = []
-    for uid, meta in products.items():
-        results.append({
+    results = [
+        {
             "uuid": uid,
             "title": meta.get("title", ""),
             "date": str(meta.get("beginposition", ""))[:10],
             "cloud_cover": meta.get("cloudcoverpercentage", -1),
-        })
+        }
+        for uid, meta in products.items()
+    ]
 
     # Sort by date descending
-    results.sort(key=lambda r: r["date"], reverse=True)
-    logger.info("Found %d scenes", len(results))
+    results.sort(key=itemgetter("date"), reverse=True)
     return results
 
 
@@ -1,12 +1,16 @@
 """Vector geoprocessing operations.
 
 All functions accept and return :class:`geopandas.GeoDataFrame` objects and
-support GeoPackage, GeoJSON, and Shapefile formats on disk.
+support GeoPackage, GeoJSON, Shapefile, and GeoParquet formats on disk.
 """
 
 from __future__ import annotations
 
+import functools
 import warnings
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
 from typing import TYPE_CHECKING, Union
 
@@ -15,7 +19,7 @@ from sudapy.core.errors import CRSError, FileFormatError, SudaPyError, require_e
 if TYPE_CHECKING:
     import geopandas as gpd
 from sudapy.core.logging import get_logger
-from sudapy.crs.registry import validate_epsg
+from sudapy.crs.registry import _crs_equals, validate_epsg
 
 logger = get_logger(__name__)
 
@@ -27,23 +31,96 @@ _DRIVERS: dict[str, str] = {
     ".geojson": "GeoJSON",
     ".json": "GeoJSON",
     ".shp": "ESRI Shapefile",
+    ".parquet": "Parquet",
+    ".geoparquet": "Parquet",
 }
 
+# GeoParquet goes through GeoDataFrame.to_parquet / read_parquet (pyarrow)
+# rather than an OGR driver: columnar and compressed, it is the quickest
+# format for intermediate results.
+_PARQUET_SUFFIXES = {".parquet", ".geoparquet"}
 
-def _read(path: PathLike):
+
+# pyogrio reads and writes whole columns through GDAL instead of iterating
+# records one at a time like Fiona; with pyarrow present, reads also stream
+# Arrow batches straight into the GeoDataFrame. Fiona remains the fallback.
+_ENGINE = "pyogrio" if find_spec("pyogrio") else "fiona"
+_READ_KWARGS: dict[str, object] = {"engine": _ENGINE}
+if _ENGINE == "pyogrio" and find_spec("pyarrow"):
+    _READ_KWARGS["use_arrow"] = True
+
+
+def _read(path: PathLike, *, within=None, columns: Sequence[str] | None = None):
+    """Read a vector file.
+
+    *columns* limits the attribute columns read (the geometry always comes
+    along); skipping unused fields saves decoding them at all.
+
+    *within* is an optional GeoDataFrame: only features intersecting its
+    total bounds are read. For OGR formats the bounding box is pushed down
+    to the driver, which answers it from the spatial index (GPKG R-tree,
+    FlatGeobuf, shapefile ``.qix``) where there is one; GeoParquet is read
+    in full.
+    """
     gpd = require_extra("geopandas", "geo")
     path = Path(path)
     if not path.exists():
         raise FileFormatError(f"File not found: {path}")
+    if path.suffix.lower() in _PARQUET_SUFFIXES:
+        require_extra("pyarrow", "parquet")
+        reader, kwargs = gpd.read_parquet, {}
+        if columns is not None:
+            kwargs["columns"] = [*columns, _parquet_geometry_column(path)]
+    else:
+        reader, kwargs = gpd.read_file, dict(_READ_KWARGS)
+        bbox = _bbox_filter(path, within) if within is not None else None
+        if bbox is not None:
+            kwargs["bbox"] = bbox
+        if columns is not None:
+            kwargs["columns"] = list(columns)
     try:
-        return gpd.read_file(path)
+        return reader(path, **kwargs)
     except Exception as exc:
         raise FileFormatError(
             f"Cannot read vector file: {path}",
-            hint="Supported formats: GeoPackage (.gpkg), GeoJSON, Shapefile (.shp).",
+            hint=(
+                "Supported formats: GeoPackage (.gpkg), GeoJSON, Shapefile (.shp), "
+                "GeoParquet (.parquet)."
+            ),
         ) from exc
 
 
+def _parquet_geometry_column(path: Path) -> str:
+    """Return the primary geometry column named in a GeoParquet file's metadata."""
+    import json
+
+    import pyarrow.parquet as pq
+
+    metadata = pq.read_schema(path).metadata or {}
+    try:
+        return json.loads(metadata[b"geo"])["primary_column"]
+    except (KeyError, ValueError):
+        return "geometry"
+
+
+def _bbox_filter(path: Path, within):
+    """Return a ``bbox`` filter for reading *path*, or ``None`` to read it all."""
+    if within.crs is None or within.empty:
+        return None
+    if _ENGINE != "pyogrio":
+        # Fiona reprojects a GeoDataFrame bbox to the layer CRS itself.
+        return within
+    import pyogrio
+
+    try:
+        crs = pyogrio.read_info(path).get("crs")
+    except Exception:
+        return None  # let the full read report the problem
+    if crs is None:
+        return None
+    return tuple(within.to_crs(crs).total_bounds.tolist())
+
+
 def _write(gdf, path: PathLike) -> Path:
     path = Path(path)
     suffix = path.suffix.lower()
@@ -53,8 +130,19 @@ def _write(gdf, path: PathLike) -> Path:
             f"Unsupported output format '{suffix}'",
             hint=f"Use one of: {', '.join(_DRIVERS.keys())}",
         )
+    if suffix in _PARQUET_SUFFIXES:
+        require_extra("pyarrow", "parquet")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        gdf.to_parquet(path, compression="zstd")
+        logger.info("Wrote %d features to %s", len(gdf), path)
+        return path
+
     path.parent.mkdir(parents=True, exist_ok=True)
-    gdf.to_file(path, driver=driver)
+    # Both engines already insert a GeoPackage layer inside one SQLite
+    # transaction (pyogrio natively, Fiona via writerecords), so the
+    # per-feature commit cost does not apply here. OGR_SQLITE_SYNCHRONOUS /
+    # OGR_SQLITE_JOURNAL config options were measured to make no difference.
+    gdf.to_file(path, driver=driver, engine=_ENGINE)
     logger.info("Wrote %d features to %s", len(gdf), path)
     return path
 
@@ -67,10 +155,106 @@ def _ensure_projected(gdf):
             hint="Set a CRS first, e.g. 'sudapy vector reproject --in file --out file --to 32635'.",
         )
     if gdf.crs.is_geographic:
-        return gdf.to_crs(gdf.estimate_utm_crs())
+        return gdf.to_crs(_estimate_utm_crs(gdf))
     return gdf
 
 
+def _bounds_disjoint(mask, gdf) -> bool:
+    """Return whether *mask*'s bounds, moved to *gdf*'s CRS, miss *gdf*'s bounds.
+
+    Only the bounding box is transformed (with densified edges, so curved
+    edges in the target CRS are accounted for), not every vertex. An empty
+    *gdf* is disjoint from anything; a box that cannot be transformed is
+    treated as overlapping.
+    """
+    np = require_extra("numpy", "geo")
+    from pyproj import Transformer
+
+    if gdf.empty:
+        return True
+    transformer = Transformer.from_crs(mask.crs, gdf.crs, always_xy=True)
+    try:
+        minx, miny, maxx, maxy = transformer.transform_bounds(*mask.total_bounds)
+    except Exception:
+        return False
+    if not np.isfinite([minx, miny, maxx, maxy]).all():
+        return False
+    gminx, gminy, gmaxx, gmaxy = gdf.total_bounds
+    return maxx < gminx or minx > gmaxx or maxy < gminy or miny > gmaxy
+
+
+def _estimate_utm_crs(gdf):
+    """Return ``gdf.estimate_utm_crs()``, cached by CRS and total bounds.
+
+    The estimate depends only on the dataset's bounds, so results are cached
+    per (CRS, total bounds) and operations chained on the same data share one
+    PROJ database query.
+    """
+    if gdf.empty:
+        return gdf.estimate_utm_crs()
+    return _utm_for_bounds(gdf.crs, tuple(gdf.total_bounds.tolist()))
+
+
+@functools.lru_cache(maxsize=64)
+def _utm_for_bounds(crs, bounds: tuple[float, float, float, float]):
+    gpd = require_extra("geopandas", "geo")
+    from shapely.geometry import box
+
+    # A single box with the same bounds gives the same estimate.
+    return gpd.GeoSeries([box(*bounds)], crs=crs).estimate_utm_crs()
+
+
+def _map_geoms(func, geoseries, n_partitions: int | None = None):
+    """Apply the vectorised Shapely *func* to the geometries of *geoseries*.
+
+    *geoseries* may also be a NumPy array of geometries.
+
+    With ``n_partitions > 1`` the geometry array is split row-wise into that
+    many chunks, which are processed concurrently on a thread pool: Shapely 2
+    releases the GIL inside GEOS, so the chunks run in parallel. Features are
+    never split, so one huge geometry still runs on a single core.
+
+    Returns:
+        A NumPy array aligned with *geoseries*.
+    """
+    np = require_extra("numpy", "geo")
+
+    geoms = np.asarray(getattr(geoseries, "array", geoseries))
+    if n_partitions is None or n_partitions <= 1 or len(geoms) < 2:
+        return func(geoms)
+    chunks = np.array_split(geoms, min(n_partitions, len(geoms)))
+    with ThreadPoolExecutor(len(chunks)) as pool:
+        return np.concatenate(list(pool.map(func, chunks)))
+
+
+def _apply_vec(gdf, func, n_partitions: int | None = None):
+    """Return a new GeoDataFrame with *func* applied to *gdf*'s geometry array.
+
+    *func* is a vectorised Shapely function; the result is wrapped into a
+    GeoSeries once, with *gdf*'s index and CRS. *gdf* itself is not modified.
+    """
+    return _replace_geometry(gdf, _map_geoms(func, gdf.geometry, n_partitions))
+
+
+def _replace_geometry(gdf, geoms):
+    """Return a new GeoDataFrame with *gdf*'s attributes and *geoms* as geometry.
+
+    Unlike ``gdf.copy()`` followed by a geometry assignment, the old
+    geometry column is never copied only to be thrown away.
+    """
+    gpd = require_extra("geopandas", "geo")
+    name = gdf.geometry.name
+    attrs = gdf.drop(columns=name)
+    attrs.insert(gdf.columns.get_loc(name), name, _geoseries_like(gdf.geometry, geoms))
+    return gpd.GeoDataFrame(attrs, geometry=name, crs=gdf.crs)
+
+
+def _geoseries_like(geoseries, geoms):
+    """Wrap a geometry array in a GeoSeries with *geoseries*' index and CRS."""
+    gpd = require_extra("geopandas", "geo")
+    return gpd.GeoSeries(geoms, index=geoseries.index, crs=geoseries.crs)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -80,21 +264,31 @@ def reproject(
     src: PathLike | gpd.GeoDataFrame,
     to_epsg: int,
     out: PathLike | None = None,
+    *,
+    columns: Sequence[str] | None = None,
 ) -> gpd.GeoDataFrame:
     """Reproject a vector dataset to a new CRS.
 
+    Data already in an equivalent CRS (e.g. ``OGC:CRS84`` data reprojected
+    to EPSG:4326) is relabelled instead of transformed.
+
     Args:
         src: Input file path or GeoDataFrame.
         to_epsg: Target EPSG code.
         out: Optional output file path. If given the result is also saved.
+        columns: Attribute columns to read when *src* is a file (default:
+            all). The geometry column is always read.
 
     Returns:
         Reprojected GeoDataFrame.
     """
     gpd = require_extra("geopandas", "geo")
-    gdf = _read(src) if not isinstance(src, gpd.GeoDataFrame) else src
+    gdf = _read(src, columns=columns) if not isinstance(src, gpd.GeoDataFrame) else src
     target_crs = validate_epsg(to_epsg)
-    result = gdf.to_crs(target_crs)
+    if gdf.crs is not None and _crs_equals(gdf.crs.to_wkt(), target_crs.to_wkt()):
+        result = gdf.set_crs(target_crs, allow_override=True)
+    else:
+        result = gdf.to_crs(target_crs)
     if out is not None:
         _write(result, out)
     return result
@@ -104,27 +298,47 @@ def clip(
     src: PathLike | gpd.GeoDataFrame,
     clip_src: PathLike | gpd.GeoDataFrame,
     out: PathLike | None = None,
+    *,
+    columns: Sequence[str] | None = None,
 ) -> gpd.GeoDataFrame:
     """Clip a vector dataset by another vector geometry.
 
+    When *src* is a file, only the features inside the bounding box of
+    *clip_src* are read from it.
+
     Args:
         src: Input file or GeoDataFrame.
         clip_src: Clipping geometry file or GeoDataFrame.
         out: Optional output path.
+        columns: Attribute columns to read when *src* is a file (default:
+            all). The geometry column is always read.
 
     Returns:
         Clipped GeoDataFrame.
     """
     gpd = require_extra("geopandas", "geo")
-    gdf = _read(src) if not isinstance(src, gpd.GeoDataFrame) else src
-    mask = _read(clip_src) if not isinstance(clip_src, gpd.GeoDataFrame) else clip_src
-
-    # Ensure same CRS
+    # Only the clip geometry is used, so none of its attributes are read.
+    mask = _read(clip_src, columns=[]) if not isinstance(clip_src, gpd.GeoDataFrame) else clip_src
+    gdf = (
+        _read(src, within=mask, columns=columns)
+        if not isinstance(src, gpd.GeoDataFrame)
+        else src
+    )
+
+    # Ensure same CRS, unless the bounding boxes show there is nothing to clip
+    disjoint = False
     if gdf.crs and mask.crs and gdf.crs != mask.crs:
-        logger.info("Reprojecting clip geometry to match input CRS (%s)", gdf.crs)
-        mask = mask.to_crs(gdf.crs)
-
-    result = gpd.clip(gdf, mask)
+        disjoint = _bounds_disjoint(mask, gdf)
+        if disjoint:
+            logger.info("Clip geometry does not overlap the input; result is empty")
+        else:
+            logger.info("Reprojecting clip geometry to match input CRS (%s)", gdf.crs)
+            mask = mask.to_crs(gdf.crs)
+
+    # gpd.clip prunes candidates with gdf.sindex before intersecting. The
+    # STRtree is built lazily and cached on the frame, so repeated clips of
+    # the same in-memory GeoDataFrame build it only once.
+    result = gdf.iloc[:0] if disjoint else gpd.clip(gdf, mask)
     if out is not None:
         _write(result, out)
     return result
@@ -134,25 +348,35 @@ def dissolve(
     src: PathLike | gpd.GeoDataFrame,
     by: str,
     out: PathLike | None = None,
+    *,
+    columns: Sequence[str] | None = None,
 ) -> gpd.GeoDataFrame:
     """Dissolve geometries by an attribute field.
 
+    Each group is merged with a single :func:`shapely.union_all` call. Only
+    values that occur in the data form groups, so unused categories of a
+    categorical *by* column do not produce empty rows.
+
     Args:
         src: Input file or GeoDataFrame.
         by: Column name to dissolve on.
         out: Optional output path.
+        columns: Attribute columns to read when *src* is a file, besides
+            *by* (default: all). The output keeps the first value of each.
 
     Returns:
         Dissolved GeoDataFrame.
     """
     gpd = require_extra("geopandas", "geo")
-    gdf = _read(src) if not isinstance(src, gpd.GeoDataFrame) else src
+    if columns is not None and by not in columns:
+        columns = [by, *columns]
+    gdf = _read(src, columns=columns) if not isinstance(src, gpd.GeoDataFrame) else src
     if by not in gdf.columns:
         raise SudaPyError(
             f"Column '{by}' not found in dataset.",
             hint=f"Available columns: {', '.join(gdf.columns.tolist())}",
         )
-    result = gdf.dissolve(by=by).reset_index()
+    result = gdf.dissolve(by=by, observed=True).reset_index()
     if out is not None:
         _write(result, out)
     return result
@@ -162,6 +386,9 @@ def calculate_area(
     src: PathLike | gpd.GeoDataFrame,
     field: str = "area_m2",
     out: PathLike | None = None,
+    *,
+    n_partitions: int | None = None,
+    columns: Sequence[str] | None = None,
 ) -> gpd.GeoDataFrame:
     """Calculate geometry area in square meters.
 
@@ -173,12 +400,18 @@ def calculate_area(
         src: Input file or GeoDataFrame.
         field: Name of the new area column.
         out: Optional output path.
+        n_partitions: Split the features into this many row-wise chunks and
+            compute them on parallel threads (default: one chunk).
+        columns: Attribute columns to read when *src* is a file (default:
+            all). The geometry column is always read.
 
     Returns:
         GeoDataFrame with a new area column.
     """
     gpd = require_extra("geopandas", "geo")
-    gdf = _read(src) if not isinstance(src, gpd.GeoDataFrame) else src.copy()
+    import shapely
+
+    gdf = _read(src, columns=columns) if not isinstance(src, gpd.GeoDataFrame) else src.copy()
 
     if gdf.crs is None:
         raise CRSError(
@@ -194,10 +427,11 @@ def calculate_area(
             UserWarning,
             stacklevel=2,
         )
-        projected = gdf.to_crs(gdf.estimate_utm_crs())
-        gdf[field] = projected.geometry.area
+        # Only the geometry column is projected; the attributes stay put.
+        projected = gdf.geometry.to_crs(_estimate_utm_crs(gdf))
+        gdf[field] = _map_geoms(shapely.area, projected, n_partitions)
     else:
-        gdf[field] = gdf.geometry.area
+        gdf[field] = _map_geoms(shapely.area, gdf.geometry, n_partitions)
 
     if out is not None:
         _write(gdf, out)
@@ -208,6 +442,10 @@ def buffer(
     src: PathLike | gpd.GeoDataFrame,
     distance_m: float,
     out: PathLike | None = None,
+    *,
+    n_partitions: int | None = None,
+    columns: Sequence[str] | None = None,
+    keep_projected: bool = False,
 ) -> gpd.GeoDataFrame:
     """Buffer geometries by a distance in meters.
 
@@ -218,12 +456,20 @@ def buffer(
         src: Input file or GeoDataFrame.
         distance_m: Buffer distance in meters.
         out: Optional output path.
+        n_partitions: Split the features into this many row-wise chunks and
+            buffer them on parallel threads (default: one chunk).
+        columns: Attribute columns to read when *src* is a file (default:
+            all). The geometry column is always read.
+        keep_projected: For geographic input, return (and write) the result
+            in the UTM CRS it was computed in, skipping the transform back.
 
     Returns:
-        Buffered GeoDataFrame (in original CRS).
+        Buffered GeoDataFrame, in the original CRS unless *keep_projected*.
     """
     gpd = require_extra("geopandas", "geo")
-    gdf = _read(src) if not isinstance(src, gpd.GeoDataFrame) else src
+    import shapely
+
+    gdf = _read(src, columns=columns) if not isinstance(src, gpd.GeoDataFrame) else src
     original_crs = gdf.crs
 
     if original_crs is None:
@@ -232,6 +478,9 @@ def buffer(
             hint="Set a CRS so the buffer distance can be applied in meters.",
         )
 
+    def _buffer(geoms):
+        return shapely.buffer(geoms, distance_m, quad_segs=16)
+
     if original_crs.is_geographic:
         warnings.warn(
             "Input CRS is geographic. Temporarily projecting to UTM for "
@@ -239,12 +488,12 @@ def buffer(
             UserWarning,
             stacklevel=2,
         )
-        projected = gdf.to_crs(gdf.estimate_utm_crs())
-        projected["geometry"] = projected.geometry.buffer(distance_m)
-        result = projected.to_crs(original_crs)
+        projected = gdf.to_crs(_estimate_utm_crs(gdf))
+        buffered = _map_geoms(_buffer, projected.geometry, n_partitions)
+        projected[projected.geometry.name] = _geoseries_like(projected.geometry, buffered)
+        result = projected if keep_projected else projected.to_crs(original_crs)
     else:
-        result = gdf.copy()
-        result["geometry"] = result.geometry.buffer(distance_m)
+        result = _apply_vec(gdf, _buffer, n_partitions)
 
     if out is not None:
         _write(result, out)
@@ -255,6 +504,12 @@ def simplify(
     src: PathLike | gpd.GeoDataFrame,
     tolerance_m: float,
     out: PathLike | None = None,
+    *,
+    n_partitions: int | None = None,
+    backend: str = "geos",
+    max_vertices: int | None = None,
+    columns: Sequence[str] | None = None,
+    keep_projected: bool = False,
 ) -> gpd.GeoDataFrame:
     """Simplify geometries to reduce vertex count.
 
@@ -265,53 +520,156 @@ def simplify(
         src: Input file or GeoDataFrame.
         tolerance_m: Simplification tolerance in meters.
         out: Optional output path.
+        n_partitions: Split the features into this many row-wise chunks and
+            simplify them on parallel threads (default: one chunk).
+        backend: ``"geos"`` (default) runs GEOS' topology-preserving
+            simplifier. ``"numba"`` runs a JIT-compiled plain Douglas-Peucker
+            (needs ``sudapy[fast]``); it is faster on very large rings but,
+            like ``preserve_topology=False``, may let rings cross.
+        max_vertices: Keep at most this many vertices per line or ring
+            (closing vertex included), most significant first, even where
+            *tolerance_m* would keep more. Requires ``backend="numba"``.
+        columns: Attribute columns to read when *src* is a file (default:
+            all). The geometry column is always read.
+        keep_projected: For geographic input, return (and write) the result
+            in the UTM CRS it was computed in, skipping the transform back.
 
     Returns:
         Simplified GeoDataFrame.
     """
     gpd = require_extra("geopandas", "geo")
-    gdf = _read(src) if not isinstance(src, gpd.GeoDataFrame) else src
-    original_crs = gdf.crs
-
-    if original_crs and original_crs.is_geographic:
-        projected = gdf.to_crs(gdf.estimate_utm_crs())
-        projected["geometry"] = projected.geometry.simplify(tolerance_m)
-        result = projected.to_crs(original_crs)
-    else:
-        result = gdf.copy()
-        result["geometry"] = result.geometry.simplify(tolerance_m)
+    gdf = _read(src, columns=columns) if not isinstance(src, gpd.GeoDataFrame) else src
+    (result,) = _simplified(
+        gdf, [tolerance_m], n_partitions, backend, max_vertices, keep_projected
+    )
 
     if out is not None:
         _write(result, out)
     return result
 
 
+def simplify_many(
+    src: PathLike | gpd.GeoDataFrame,
+    tolerances_m: Sequence[float],
+    *,
+    n_partitions: int | None = None,
+    backend: str = "geos",
+    columns: Sequence[str] | None = None,
+    keep_projected: bool = False,
+) -> list[gpd.GeoDataFrame]:
+    """Simplify the same data at several tolerances.
+
+    Equivalent to calling :func:`simplify` once per tolerance, but the input
+    is read, and for a geographic CRS projected to UTM, only once for the
+    whole sweep.
+
+    Args:
+        src: Input file or GeoDataFrame.
+        tolerances_m: Simplification tolerances in meters.
+        n_partitions: Split the features into this many row-wise chunks and
+            simplify them on parallel threads (default: one chunk).
+        backend: ``"geos"`` or ``"numba"``; see :func:`simplify`.
+        columns: Attribute columns to read when *src* is a file (default:
+            all). The geometry column is always read.
+        keep_projected: For geographic input, return (and write) the result
+            in the UTM CRS it was computed in, skipping the transform back.
+
+    Returns:
+        One simplified GeoDataFrame per tolerance, in the order given.
+    """
+    gpd = require_extra("geopandas", "geo")
+    gdf = _read(src, columns=columns) if not isinstance(src, gpd.GeoDataFrame) else src
+    return _simplified(gdf, tolerances_m, n_partitions, backend, keep_projected=keep_projected)
+
+
+def _simplified(
+    gdf,
+    tolerances_m,
+    n_partitions,
+    backend="geos",
+    max_vertices=None,
+    keep_projected=False,
+):
+    import shapely
+
+    if max_vertices is not None:
+        if backend != "numba":
+            raise SudaPyError(
+                "max_vertices is only supported by the Douglas-Peucker backend.",
+                hint="Pass backend='numba' (needs sudapy[fast]).",
+            )
+        if max_vertices < 2:
+            raise SudaPyError(f"max_vertices must be at least 2, got {max_vertices}")
+
+    if backend == "geos":
+        simplify_func = functools.partial(shapely.simplify, preserve_topology=True)
+    elif backend == "numba":
+        require_extra("numba", "fast")
+        from sudapy.vector._simplify import dp_simplify
+
+        simplify_func = functools.partial(dp_simplify, max_vertices=max_vertices)
+    else:
+        raise SudaPyError(
+            f"Unknown simplify backend '{backend}'",
+            hint="Supported: geos, numba",
+        )
+
+    original_crs = gdf.crs
+    geographic = bool(original_crs and original_crs.is_geographic)
+    base = gdf.to_crs(_estimate_utm_crs(gdf)) if geographic else gdf
+    unproject = geographic and not keep_projected
+
+    results = []
+    for tolerance in tolerances_m:
+        simplify_fn = functools.partial(simplify_func, tolerance=tolerance)
+        result = _apply_vec(base, simplify_fn, n_partitions)
+        results.append(result.to_crs(original_crs) if unproject else result)
+    return results
+
+
 def fix_geometry(
     src: PathLike | gpd.GeoDataFrame,
     out: PathLike | None = None,
+    *,
+    n_partitions: int | None = None,
+    columns: Sequence[str] | None = None,
 ) -> gpd.GeoDataFrame:
-    """Repair invalid geometries using :func:`shapely.validation.make_valid`.
+    """Repair invalid geometries using :func:`shapely.make_valid`.
+
+    Validity is tested and repaired with Shapely's vectorised functions over
+    the whole geometry array; only the invalid geometries are rebuilt.
+    Missing (null) geometries are left as they are.
 
     Args:
         src: Input file or GeoDataFrame.
         out: Optional output path.
+        n_partitions: Split the invalid geometries into this many row-wise
+            chunks and repair them on parallel threads (default: one chunk).
+        columns: Attribute columns to read when *src* is a file (default:
+            all). The geometry column is always read.
 
     Returns:
         GeoDataFrame with all geometries made valid.
     """
     gpd = require_extra("geopandas", "geo")
-    from shapely.validation import make_valid  # noqa: E402
+    np = require_extra("numpy", "geo")
+    import shapely
 
-    gdf = _read(src) if not isinstance(src, gpd.GeoDataFrame) else src.copy()
+    from_frame = isinstance(src, gpd.GeoDataFrame)
+    gdf = src if from_frame else _read(src, columns=columns)
 
-    invalid_count = int((~gdf.geometry.is_valid).sum())
+    geoms = np.asarray(gdf.geometry.array)
+    invalid = ~(shapely.is_valid(geoms) | shapely.is_missing(geoms))
+    invalid_count = int(invalid.sum())
     if invalid_count > 0:
         logger.info("Fixing %d invalid geometries", invalid_count)
-        gdf["geometry"] = gdf.geometry.apply(
-            lambda g: make_valid(g) if g is not None and not g.is_valid else g
-        )
+        fixed = geoms.copy()
+        fixed[invalid] = _map_geoms(shapely.make_valid, geoms[invalid], n_partitions)
+        gdf = _replace_geometry(gdf, fixed)
     else:
         logger.info("All geometries are already valid")
+        if from_frame:
+            gdf = gdf.copy()
 
     if out is not None:
         _write(gdf, out)
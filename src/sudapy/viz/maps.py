@@ -18,6 +18,12 @@ PathLike = Union[str, Path]
 _RASTER_EXTS = {".tif", ".tiff", ".img", ".vrt"}
 _VECTOR_EXTS = {".gpkg", ".geojson", ".json", ".shp"}
 
+_STATIC_FIGSIZE = 10  # inches
+_STATIC_DPI = 150
+# Interactive maps open on the full extent but can be zoomed in; keep detail
+# down to a tenth of a pixel four zoom levels (16x) deeper than that view.
+_HTML_PIXELS = _STATIC_FIGSIZE * _STATIC_DPI * 16
+
 
 def _is_raster(path: Path) -> bool:
     return path.suffix.lower() in _RASTER_EXTS
@@ -27,6 +33,36 @@ def _is_vector(path: Path) -> bool:
     return path.suffix.lower() in _VECTOR_EXTS
 
 
+def _decimate(gdf, pixels: int):
+    """Drop vertices too close together to show on a *pixels*-wide render.
+
+    The tolerance is a tenth of a pixel at the dataset's full extent, in the
+    data's own CRS units, so the rendered shapes are unchanged while
+    matplotlib or Leaflet get far fewer vertices to draw.
+    """
+    import shapely
+
+    minx, miny, maxx, maxy = gdf.total_bounds
+    span = max(maxx - minx, maxy - miny)
+    if not span > 0:  # empty or single point (NaN bounds compare False)
+        return gdf
+    tolerance = span / (pixels * 10)
+    geoms = shapely.simplify(gdf.geometry.array, tolerance, preserve_topology=True)
+    return gdf.set_geometry(geoms, crs=gdf.crs)
+
+
+def _feature_collection(gdf) -> dict:
+    """Return *gdf* as a GeoJSON FeatureCollection dict for folium.
+
+    Unlike ``__geo_interface__`` it skips per-feature bboxes and index ids,
+    which only bloat the embedded GeoJSON.
+    """
+    return {
+        "type": "FeatureCollection",
+        "features": list(gdf.iterfeatures(drop_id=True)),
+    }
+
+
 def quick_map(
     src: PathLike,
     out: PathLike,
@@ -65,11 +101,12 @@ def _export_static(src: Path, out: Path, *, title: str | None = None) -> Path:
     check_import("matplotlib", extra="viz")
     import matplotlib.pyplot as plt
 
-    fig, ax = plt.subplots(1, 1, figsize=(10, 10))
+    size = _STATIC_FIGSIZE
+    fig, ax = plt.subplots(1, 1, figsize=(size, size))
 
     if _is_vector(src):
         gpd = require_extra("geopandas", "geo")
-        gdf = gpd.read_file(src)
+        gdf = _decimate(gpd.read_file(src), size * _STATIC_DPI)
         gdf.plot(ax=ax, edgecolor="black", linewidth=0.5)
     elif _is_raster(src):
         rasterio = require_extra("rasterio", "geo")
@@ -85,7 +122,7 @@ def _export_static(src: Path, out: Path, *, title: str | None = None) -> Path:
 
     ax.set_title(title or src.stem)
     ax.set_axis_off()
-    fig.savefig(out, dpi=150, bbox_inches="tight")
+    fig.savefig(out, dpi=_STATIC_DPI, bbox_inches="tight")
     plt.close(fig)
     logger.info("Static map saved to %s", out)
     return out
@@ -98,15 +135,14 @@ def _export_html(src: Path, out: Path, *, title: str | None = None) -> Path:
     if _is_vector(src):
         gpd = require_extra("geopandas", "geo")
         gdf = gpd.read_file(src)
-        gdf_wgs = gdf.to_crs(4326)
+        gdf_wgs = _decimate(gdf.to_crs(4326), _HTML_PIXELS)
         bounds = gdf_wgs.total_bounds  # minx, miny, maxx, maxy
         center = [(bounds[1] + bounds[3]) / 2, (bounds[0] + bounds[2]) / 2]
 
         m = folium.Map(location=center, zoom_start=8, tiles="OpenStreetMap")
-        folium.GeoJson(
-            gdf_wgs.__geo_interface__,
-            name=title or src.stem,
-        ).add_to(m)
+        # folium keeps a dict as-is (a JSON string would just be parsed back
+        # into one), so hand over the plain feature dict.
+        folium.GeoJson(_feature_collection(gdf_wgs), name=title or src.stem).add_to(m)
         folium.LayerControl().add_to(m)
         m.save(str(out))
     elif _is_raster(src):
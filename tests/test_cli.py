@@ -0,0 +1,188 @@
+"""Tests for CLI dispatch."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from sudapy.cli.main import app
+
+runner = CliRunner()
+
+
+class TestDispatch:
+    def test_root_help_lists_all_groups(self):
+        result = runner.invoke(app, ["--help"])
+        assert result.exit_code == 0
+        for group in ("crs", "vector", "raster", "map", "rs"):
+            assert group in result.output
+
+    def test_crs_list(self):
+        result = runner.invoke(app, ["crs", "list"])
+        assert result.exit_code == 0
+        assert "32636" in result.output
+
+    def test_crs_suggest_json(self):
+        import json
+
+        result = runner.invoke(
+            app, ["crs", "suggest", "--lon", "32.5", "--lat", "15.6", "--format", "json"]
+        )
+        assert result.exit_code == 0
+        assert json.loads(result.output)[0]["EPSG"] == 32636
+
+    def test_piped_tables_are_tab_separated(self):
+        result = runner.invoke(app, ["crs", "list"], env={"SUDAPY_PLAIN": None})
+        assert result.output.splitlines()[0] == "EPSG\tName\tRegion\tDescription"
+
+    def test_group_on_argv_loads_only_that_group(self):
+        code = (
+            "import sys; sys.argv = ['sudapy', 'crs', 'list']\n"
+            "from sudapy.cli import main\n"
+            "try:\n    main()\nexcept SystemExit:\n    pass\n"
+            "print(sorted(m for m in sys.modules if m.startswith('sudapy.cli._')))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout.splitlines()[-1]
+        assert "sudapy.cli._crs" in out
+        assert "sudapy.cli._raster" not in out
+
+    def test_import_registers_every_group_regardless_of_argv(self):
+        code = (
+            "import sys; sys.argv = ['host', 'crs']; "
+            "from sudapy.cli.main import app; "
+            "print(sorted(g.name for g in app.registered_groups))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        for group in ("crs", "vector", "raster", "map", "rs", "doctor"):
+            assert repr(group) in out
+
+    def test_version_fast_path_skips_typer(self):
+        code = (
+            "import sys; sys.argv = ['sudapy', '--version']; "
+            "from sudapy.cli import main; main(); "
+            "print('typer' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout.split()
+        assert out[0] == "sudapy"
+        assert out[-1] == "False"
+
+    def test_version_option(self):
+        result = runner.invoke(app, ["--version"])
+        assert result.exit_code == 0
+        assert result.output.startswith("sudapy ")
+
+
+class TestDoctor:
+    @pytest.fixture(autouse=True)
+    def _cache_home(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    def test_proj_check_is_cached(self, tmp_path):
+        first = runner.invoke(app, ["doctor"])
+        second = runner.invoke(app, ["doctor"])
+        forced = runner.invoke(app, ["doctor", "--no-cache"])
+        assert (tmp_path / "sudapy" / "doctor.json").exists()
+        assert "cached" not in first.output
+        assert "cached" in second.output
+        assert "cached" not in forced.output
+
+    def test_cache_dir_uses_localappdata_on_windows(self, tmp_path, monkeypatch):
+        from sudapy.cli import _doctor
+
+        monkeypatch.setattr(_doctor.sys, "platform", "win32")
+        monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "local"))
+        assert _doctor._cache_dir() == tmp_path / "local" / "sudapy"
+
+    def test_default_runs_core_only(self):
+        result = runner.invoke(app, ["doctor"])
+        assert result.exit_code == 0
+        assert "PROJ data available" in result.output
+        assert "GeoPackage" not in result.output
+
+    def test_all_includes_geo(self):
+        result = runner.invoke(app, ["doctor", "all"])
+        assert result.exit_code == 0
+        assert "GeoPackage driver" in result.output
+        assert "GeoPackage read/write" not in result.output
+
+    def test_gpkg_roundtrip_opt_in(self):
+        result = runner.invoke(app, ["doctor", "geo", "--gpkg"])
+        assert result.exit_code == 0
+        assert "GeoPackage read/write" in result.output
+
+
+class TestBatch:
+    @pytest.fixture()
+    def input_dir(self, tmp_path):
+        gpd = pytest.importorskip("geopandas")
+        from shapely.geometry import box
+
+        src = tmp_path / "in"
+        src.mkdir()
+        for i in range(3):
+            gdf = gpd.GeoDataFrame(
+                {"id": [i]}, geometry=[box(500_000, 1_700_000, 501_000, 1_701_000)],
+                crs="EPSG:32636",
+            )
+            gdf.to_file(src / f"f{i}.gpkg", driver="GPKG")
+        return src
+
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_area(self, input_dir, tmp_path, jobs):
+        out = tmp_path / "out"
+        result = runner.invoke(
+            app, ["batch", "area", "--in", str(input_dir), "--out", str(out), "--jobs", jobs]
+        )
+        assert result.exit_code == 0
+        assert "3/3 files processed" in result.output
+        assert sorted(p.name for p in out.iterdir()) == ["f0.gpkg", "f1.gpkg", "f2.gpkg"]
+
+    def test_missing_option_fails_fast(self, input_dir, tmp_path):
+        result = runner.invoke(
+            app, ["batch", "buffer", "--in", str(input_dir), "--out", str(tmp_path / "out")]
+        )
+        assert result.exit_code == 1
+        assert "--distance is required" in result.output
+        assert not (tmp_path / "out").exists()
+
+
+class TestReport:
+    def test_counts_null_and_invalid(self, tmp_path):
+        gpd = pytest.importorskip("geopandas")
+        from shapely.geometry import Point, Polygon, box
+
+        bowtie = Polygon([(0, 0), (1, 1), (1, 0), (0, 1)])
+        path = tmp_path / "mixed.gpkg"
+        gpd.GeoDataFrame(
+            {"id": [1, 2, 3, 4]},
+            geometry=[box(0, 0, 1, 1), None, Point(0, 0), bowtie],
+            crs="EPSG:4326",
+        ).to_file(path, driver="GPKG")
+
+        result = runner.invoke(app, ["report", "--in", str(path)])
+        assert result.exit_code == 0
+        assert "Point, Polygon" in result.output
+        assert "Null geometries" in result.output
+
+
+class TestInit:
+    def test_creates_layout(self, tmp_path):
+        root = tmp_path / "proj"
+        result = runner.invoke(app, ["init", str(root)])
+        assert result.exit_code == 0
+        for sub in ("data_raw", "data_clean", "outputs", "maps", "scripts"):
+            assert (root / sub).is_dir()
+        assert (root / "scripts" / "process.py").read_text(encoding="utf-8").startswith('"""')
+
+    def test_existing_directory_fails(self, tmp_path):
+        result = runner.invoke(app, ["init", str(tmp_path)])
+        assert result.exit_code == 1
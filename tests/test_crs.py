@@ -8,6 +8,7 @@ from sudapy.crs.registry import (
     get_preset,
     list_presets,
     suggest_utm_zone,
+    suggest_utm_zone_batch,
     validate_epsg,
 )
 
@@ -17,6 +18,10 @@ class TestListPresets:
         presets = list_presets()
         assert len(presets) >= 6
 
+    def test_is_immutable_and_shared(self):
+        assert isinstance(list_presets(), tuple)
+        assert list_presets() is list_presets()
+
     def test_contains_wgs84(self):
         presets = list_presets()
         epsg_codes = [p.epsg for p in presets]
@@ -78,6 +83,22 @@ class TestSuggestUTMZone:
         assert suggestions[0]["hemisphere"] == "S"
         assert suggestions[0]["epsg"] == 32736  # zone 36S
 
+    def test_names(self):
+        suggestions = suggest_utm_zone(32.5, 15.6)
+        assert suggestions[0]["name"] == "WGS 84 / UTM zone 36N"
+        assert suggestions[1]["name"] == "Adindan / UTM zone 36N"
+        assert suggest_utm_zone(-70.0, -33.4)[0]["name"] == "WGS 84 / UTM zone 19S"
+
+    def test_secondary_datum_zones_are_presets(self):
+        from sudapy.crs.registry import _DATUM_ZONE_EPSG
+
+        for epsg in _DATUM_ZONE_EPSG.values():
+            assert get_preset(epsg) is not None
+
+    def test_antimeridian_is_zone_60(self):
+        assert suggest_utm_zone(180.0, 10.0)[0]["epsg"] == 32660
+        assert suggest_utm_zone_batch([180.0], [-10.0]).tolist() == [32760]
+
     def test_invalid_longitude(self):
         with pytest.raises(ValueError, match="Longitude"):
             suggest_utm_zone(200, 15)
@@ -87,6 +108,19 @@ class TestSuggestUTMZone:
             suggest_utm_zone(32, 100)
 
 
+class TestSuggestUTMZoneBatch:
+    def test_matches_scalar(self):
+        lons = [22.0, 27.5, 32.5, 38.9, -70.0]
+        lats = [12.0, 15.6, 15.6, 18.0, -33.4]
+        codes = suggest_utm_zone_batch(lons, lats)
+        expected = [suggest_utm_zone(lon, lat)[0]["epsg"] for lon, lat in zip(lons, lats)]
+        assert codes.tolist() == expected
+
+    def test_out_of_range_raises(self):
+        with pytest.raises(ValueError):
+            suggest_utm_zone_batch([32.0, 200.0], [15.0, 15.0])
+
+
 class TestValidateEpsg:
     def test_valid(self):
         crs = validate_epsg(4326)
@@ -97,3 +131,27 @@ class TestValidateEpsg:
 
         with pytest.raises(CRSError):
             validate_epsg(0)
+
+    def test_repeat_lookups_are_cached(self):
+        assert validate_epsg(32636) is validate_epsg(32636)
+
+    def test_invalid_is_not_cached(self):
+        from sudapy.core.errors import CRSError
+
+        for _ in range(2):
+            with pytest.raises(CRSError):
+                validate_epsg(0)
+
+
+class TestCRSEquals:
+    def test_axis_order_is_ignored(self):
+        from pyproj import CRS
+
+        from sudapy.crs.registry import _crs_equals
+
+        assert _crs_equals(CRS.from_epsg(4326).to_wkt(), CRS("OGC:CRS84").to_wkt())
+
+    def test_different_crs(self):
+        from sudapy.crs.registry import _crs_equals
+
+        assert not _crs_equals(validate_epsg(4326).to_wkt(), validate_epsg(32636).to_wkt())
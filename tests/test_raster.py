@@ -0,0 +1,205 @@
+"""Tests for raster operations."""
+
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy", reason="numpy not installed (needs sudapy[geo])")
+rasterio = pytest.importorskip("rasterio", reason="rasterio not installed (needs sudapy[geo])")
+from affine import Affine  # noqa: E402
+
+from sudapy.raster import _terrain  # noqa: E402
+from sudapy.raster.ops import hillshade, slope  # noqa: E402
+
+try:
+    tuple(Affine.identity())
+    _AFFINE_ITERABLE = True
+except TypeError:  # affine 3 with attrs < 23.1 cannot unpack transforms or bounds
+    _AFFINE_ITERABLE = False
+
+_TRANSFORM = Affine(30.0, 0.0, 500_000.0, 0.0, -30.0, 1_700_000.0)
+
+
+def _make_dem() -> np.ndarray:
+    """A small synthetic DEM: a tilted plane with a bump, 30 m cells."""
+    y, x = np.mgrid[0:12, 0:15].astype(np.float64)
+    return 2.0 * x + 0.5 * y + 10.0 * np.exp(-((x - 7) ** 2 + (y - 6) ** 2) / 8.0)
+
+
+def _write_dem(path, dem) -> None:
+    with rasterio.open(
+        path, "w", driver="GTiff", width=dem.shape[1], height=dem.shape[0], count=1,
+        dtype=str(dem.dtype), crs="EPSG:32636", transform=_TRANSFORM,
+    ) as dst:
+        dst.write(dem, 1)
+
+
+class TestTerrainKernels:
+    """The fused per-cell kernels must match the np.gradient reference."""
+
+    def test_slope_kernel_matches_numpy(self):
+        dem = _make_dem()
+        out = np.empty(dem.shape, dtype=np.float32)
+        _terrain._slope_kernel(dem, 30.0, 30.0, out)
+        grad_y, grad_x = np.gradient(dem, 30.0, 30.0)
+        expected = np.degrees(np.arctan(np.hypot(grad_x, grad_y)))
+        np.testing.assert_allclose(out, expected, rtol=1e-5, atol=1e-4)
+
+    def test_hillshade_kernel_matches_numpy(self):
+        dem = _make_dem()
+        out = np.empty(dem.shape, dtype=np.float32)
+        az_rad = np.radians(360.0 - 315.0 + 90.0)
+        _terrain._hillshade_kernel(dem, 30.0, 30.0, az_rad, np.radians(45.0), out)
+        np.testing.assert_allclose(
+            out, _terrain.compute_hillshade(dem, 30.0, 30.0, 315.0, 45.0), rtol=1e-5, atol=1e-3
+        )
+
+
+class TestTerrainOps:
+    @pytest.mark.parametrize("dtype", ["float32", "float64", "int16", "uint16"])
+    def test_slope_writes_float32(self, tmp_path, dtype):
+        src = tmp_path / "dem.tif"
+        _write_dem(src, _make_dem().astype(dtype))
+        out = slope(src, tmp_path / "slope.tif")
+        with rasterio.open(out) as ds:
+            data = ds.read(1)
+        assert data.dtype == np.float32
+        assert data.min() >= 0.0 and data.max() < 90.0
+
+    def test_float32_matches_float64_at_altitude(self, tmp_path):
+        # Single precision is enough even on a plateau thousands of metres up.
+        dem = _make_dem() + 3000.0
+        src = tmp_path / "dem.tif"
+        _write_dem(src, dem)
+        out = slope(src, tmp_path / "slope.tif")
+        with rasterio.open(out) as ds:
+            data = ds.read(1)
+        grad_y, grad_x = np.gradient(dem, 30.0, 30.0)
+        expected = np.degrees(np.arctan(np.hypot(grad_x, grad_y)))
+        np.testing.assert_allclose(data, expected, atol=0.01)
+
+    def test_output_is_tiled_zstd(self, tmp_path):
+        src = tmp_path / "dem.tif"
+        _write_dem(src, _make_dem())
+        out = slope(src, tmp_path / "slope.tif")
+        with rasterio.open(out) as ds:
+            structure = ds.tags(ns="IMAGE_STRUCTURE")
+            assert ds.profile["tiled"]
+        assert structure["COMPRESSION"] == "ZSTD"
+        assert structure["PREDICTOR"] == "3"
+
+    def test_hillshade_range(self, tmp_path):
+        src = tmp_path / "dem.tif"
+        _write_dem(src, _make_dem())
+        out = hillshade(src, tmp_path / "hs.tif")
+        with rasterio.open(out) as ds:
+            data = ds.read(1)
+        assert data.min() >= 0.0 and data.max() <= 255.0
+
+    def test_tiled_output_matches_full_computation(self, tmp_path, monkeypatch):
+        from sudapy.raster import ops
+
+        monkeypatch.setattr(ops, "_TERRAIN_BLOCK", 16)
+        y, x = np.mgrid[0:40, 0:50].astype(np.float64)
+        dem = 3.0 * x + np.sin(y / 3.0) * 20.0 + np.cos(x / 4.0) * 15.0
+        src = tmp_path / "dem.tif"
+        _write_dem(src, dem)
+
+        out = slope(src, tmp_path / "slope.tif")
+        with rasterio.open(out) as ds:
+            assert ds.block_shapes == [(16, 16)]
+            data = ds.read(1)
+        expected = _terrain.compute_slope(dem.astype(np.float32), 30.0, 30.0)
+        np.testing.assert_allclose(data, expected, rtol=1e-6)
+
+
+class TestGTiffProfile:
+    @pytest.mark.parametrize(
+        ("dtype", "predictor"),
+        [("float32", 3), ("float64", 3), ("uint8", 2), ("int16", 2), ("complex64", 1)],
+    )
+    def test_predictor_follows_dtype(self, dtype, predictor):
+        from sudapy.raster.ops import _gtiff_profile
+
+        profile = _gtiff_profile(dtype)
+        assert profile["predictor"] == predictor
+        assert profile["compress"] == "zstd" and profile["tiled"]
+
+
+class TestResamplingLookup:
+    def test_known_methods(self):
+        from rasterio.enums import Resampling
+
+        from sudapy.raster.ops import _get_resampling
+
+        assert _get_resampling("lanczos") is Resampling.lanczos
+        assert _get_resampling("average") is Resampling.average
+
+    def test_unknown_method_lists_supported(self):
+        from sudapy.core.errors import SudaPyError
+        from sudapy.raster.ops import _get_resampling
+
+        with pytest.raises(SudaPyError, match="Unknown resampling method 'sinc'") as exc:
+            _get_resampling("sinc")
+        assert "nearest, bilinear, cubic, lanczos, average" in exc.value.hint
+
+
+@pytest.mark.skipif(not _AFFINE_ITERABLE, reason="installed affine/attrs cannot unpack transforms")
+class TestReproject:
+    def test_multiband_matches_serial_warp(self, tmp_path):
+        from rasterio.warp import reproject as rio_reproject
+
+        from sudapy.raster.ops import reproject_raster
+
+        src = tmp_path / "stack.tif"
+        bands = np.stack([_make_dem() * (k + 1) for k in range(3)]).astype(np.float32)
+        with rasterio.open(
+            src, "w", driver="GTiff", width=15, height=12, count=3, dtype="float32",
+            nodata=-9999.0, crs="EPSG:32636", transform=_TRANSFORM,
+        ) as dst:
+            dst.write(bands)
+
+        out = reproject_raster(src, tmp_path / "wgs84.tif", 4326)
+        with rasterio.open(out) as ds:
+            assert ds.count == 3 and ds.crs.to_epsg() == 4326
+            assert ds.nodata == -9999.0
+            for i in range(1, 4):
+                expected = np.empty(ds.shape, dtype=np.float32)
+                rio_reproject(
+                    bands[i - 1], expected, src_transform=_TRANSFORM, src_crs="EPSG:32636",
+                    src_nodata=-9999.0, dst_transform=ds.transform, dst_crs=ds.crs,
+                    dst_nodata=-9999.0,
+                )
+                np.testing.assert_array_equal(ds.read(i), expected)
+
+
+class TestMosaic:
+    @pytest.mark.skipif(not _AFFINE_ITERABLE, reason="installed affine/attrs cannot unpack transforms")
+    def test_tiles_merge_side_by_side(self, tmp_path):
+        from sudapy.raster.ops import mosaic
+
+        tiles = tmp_path / "tiles"
+        tiles.mkdir()
+        for k in range(2):
+            with rasterio.open(
+                tiles / f"t{k}.tif", "w", driver="GTiff", width=20, height=20, count=1,
+                dtype="int16", crs="EPSG:32636",
+                transform=Affine(30.0, 0.0, 500_000.0 + 600.0 * k, 0.0, -30.0, 1_700_000.0),
+            ) as dst:
+                dst.write(np.full((20, 20), k + 1, dtype="int16"), 1)
+
+        out = mosaic(tiles, tmp_path / "out" / "mosaic.tif")
+        with rasterio.open(out) as ds:
+            data = ds.read(1)
+            assert ds.tags(ns="IMAGE_STRUCTURE")["PREDICTOR"] == "2"
+        assert data.shape == (20, 40)
+        assert (data[:, :20] == 1).all() and (data[:, 20:] == 2).all()
+
+    def test_ignores_directories_and_other_files(self, tmp_path):
+        from sudapy.core.errors import FileFormatError
+        from sudapy.raster.ops import mosaic
+
+        (tmp_path / "nested.tif").mkdir()
+        (tmp_path / "notes.txt").write_text("not a raster")
+        with pytest.raises(FileFormatError, match="No raster files found"):
+            mosaic(tmp_path, tmp_path / "out.tif")
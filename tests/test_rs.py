@@ -0,0 +1,70 @@
+"""Tests for Sentinel scene search (no network: the hub API is faked)."""
+
+from __future__ import annotations
+
+import pytest
+
+from sudapy.rs import sentinel
+
+
+class _FakeAPI:
+    def __init__(self):
+        self.calls = 0
+
+    def query(self, footprint, **kwargs):
+        self.calls += 1
+        return {
+            "uuid-old": {
+                "title": "S2A_old", "beginposition": "2024-01-05T08:00:00",
+                "cloudcoverpercentage": 12.5,
+            },
+            "uuid-new": {
+                "title": "S2A_new", "beginposition": "2024-01-20T08:00:00",
+                "cloudcoverpercentage": 3.0,
+            },
+        }
+
+
+@pytest.fixture
+def api(monkeypatch):
+    fake = _FakeAPI()
+    monkeypatch.setattr(sentinel, "_get_api", lambda: fake)
+    sentinel._query_cached.cache_clear()
+    yield fake
+    sentinel._query_cached.cache_clear()
+
+
+def _search(**kwargs):
+    return sentinel.search_scenes(
+        lon=32.5, lat=15.6, start_date="2024-01-01", end_date="2024-01-31", **kwargs
+    )
+
+
+class TestSearchCache:
+    def test_results_newest_first(self, api):
+        assert [r["uuid"] for r in _search()] == ["uuid-new", "uuid-old"]
+
+    def test_identical_query_is_cached(self, api):
+        first = _search()
+        second = _search()
+        assert api.calls == 1
+        assert first == second
+
+    def test_different_query_is_not_cached(self, api):
+        _search()
+        _search(max_cloud=10)
+        assert api.calls == 2
+
+    def test_mutating_results_does_not_touch_cache(self, api):
+        results = _search()
+        results[0]["title"] = "changed"
+        results.clear()
+        again = _search()
+        assert api.calls == 1
+        assert again[0]["title"] == "S2A_new"
+        assert len(again) == 2
+
+    def test_cache_false_always_queries(self, api):
+        _search(cache=False)
+        _search(cache=False)
+        assert api.calls == 2
@@ -12,9 +12,12 @@ from shapely.geometry import Polygon, box  # noqa: E402
 from sudapy.vector.ops import (  # noqa: E402
     buffer,
     calculate_area,
+    clip,
+    dissolve,
     fix_geometry,
     reproject,
     simplify,
+    simplify_many,
 )
 
 
@@ -36,6 +39,18 @@ class TestReproject:
         result = reproject(gdf, to_epsg=32636)
         assert len(result) == len(gdf)
 
+    def test_equivalent_crs_is_relabelled_not_transformed(self, monkeypatch):
+        gdf = _make_gdf(32635).to_crs("OGC:CRS84")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("to_crs should not be called")
+
+        monkeypatch.setattr(gpd.GeoDataFrame, "to_crs", fail)
+        result = reproject(gdf, 4326)
+        assert result.crs.to_epsg() == 4326
+        assert result.geometry.iloc[0].equals(gdf.geometry.iloc[0])
+        assert gdf.crs.to_string() == "OGC:CRS84"
+
 
 class TestCalculateArea:
     def test_area_projected_crs(self):
@@ -84,6 +99,19 @@ class TestBuffer:
         # Result should still be in WGS84
         assert result.crs.to_epsg() == 4326
 
+    def test_keep_projected_returns_utm(self):
+        gdf = _make_gdf(32635).to_crs(4326)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            projected = buffer(gdf, distance_m=100, keep_projected=True)
+            roundtrip = buffer(gdf, distance_m=100)
+            simplified = simplify(gdf, tolerance_m=10, keep_projected=True)
+        assert projected.crs.to_epsg() == 32635
+        assert simplified.crs.to_epsg() == 32635
+        assert projected.to_crs(4326).geometry.iloc[0].equals_exact(
+            roundtrip.geometry.iloc[0], 1e-9
+        )
+
     def test_buffer_no_crs_raises(self):
         from sudapy.core.errors import CRSError
 
@@ -93,6 +121,80 @@ class TestBuffer:
             buffer(gdf, distance_m=100)
 
 
+class TestClip:
+    def test_file_clip_matches_in_memory_clip(self, tmp_path):
+        from shapely.geometry import Point
+
+        points = gpd.GeoDataFrame(
+            {"id": range(20)},
+            geometry=[Point(500_000 + 500 * i, 1_700_000 + 500 * i) for i in range(20)],
+            crs="EPSG:32635",
+        )
+        src = tmp_path / "points.gpkg"
+        points.to_file(src)
+        # Mask in a different CRS, covering only a few of the points.
+        mask = gpd.GeoDataFrame(
+            geometry=[box(501_900, 1_701_900, 504_100, 1_704_100)], crs="EPSG:32635"
+        ).to_crs(4326)
+
+        result = clip(src, mask)
+        expected = clip(points, mask)
+        assert sorted(result["id"]) == sorted(expected["id"]) == [4, 5, 6, 7, 8]
+
+    def test_disjoint_mask_skips_reprojection(self, monkeypatch):
+        gdf = _make_gdf(32635)
+        far_away = gpd.GeoDataFrame(geometry=[box(10, 50, 11, 51)], crs="EPSG:4326")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("mask should not be reprojected")
+
+        monkeypatch.setattr(gpd.GeoDataFrame, "to_crs", fail)
+        result = clip(gdf, far_away)
+        assert result.empty
+        assert result.columns.tolist() == gdf.columns.tolist()
+
+    def test_overlapping_mask_in_other_crs_still_clips(self):
+        gdf = _make_gdf(32635)
+        mask = gpd.GeoDataFrame(
+            geometry=[box(500_000, 1_700_000, 500_500, 1_701_000)], crs="EPSG:32635"
+        ).to_crs(4326)
+        result = clip(gdf, mask)
+        assert result.geometry.iloc[0].area == pytest.approx(500_000, rel=1e-3)
+
+    def test_mask_without_crs_reads_everything(self, tmp_path):
+        from sudapy.vector.ops import _read
+
+        src = tmp_path / "box.gpkg"
+        _make_gdf().to_file(src)
+        mask = gpd.GeoDataFrame(geometry=[box(0, 0, 1, 1)])
+        assert len(_read(src, within=mask)) == 1
+
+
+class TestDissolve:
+    def test_unused_categories_are_dropped(self):
+        import pandas as pd
+
+        gdf = gpd.GeoDataFrame(
+            {"state": pd.Categorical(["a", "a", "c"], categories=["a", "b", "c"])},
+            geometry=[box(0, 0, 1, 1), box(1, 0, 2, 1), box(5, 5, 6, 6)],
+            crs="EPSG:32635",
+        )
+        result = dissolve(gdf, by="state")
+        assert result["state"].tolist() == ["a", "c"]
+        assert result.geometry.iloc[0].area == pytest.approx(2.0)
+
+
+class TestEstimateUTM:
+    def test_matches_geopandas_and_is_cached(self):
+        from sudapy.vector.ops import _estimate_utm_crs, _utm_for_bounds
+
+        gdf = _make_gdf(32635).to_crs(4326)
+        assert _estimate_utm_crs(gdf) == gdf.estimate_utm_crs()
+        hits = _utm_for_bounds.cache_info().hits
+        _estimate_utm_crs(gdf.copy())
+        assert _utm_for_bounds.cache_info().hits == hits + 1
+
+
 class TestSimplify:
     def test_simplify_reduces_vertices(self):
         # Create a polygon with many vertices
@@ -109,6 +211,96 @@ class TestSimplify:
         simplified_coords = len(result.geometry.iloc[0].exterior.coords)
         assert simplified_coords < original_coords
 
+    def test_simplify_many_matches_simplify(self):
+        import numpy as np
+
+        angles = np.linspace(0, 2 * np.pi, 100)
+        coords = [(500_000 + 500 * np.cos(a), 1_700_000 + 500 * np.sin(a)) for a in angles]
+        gdf = gpd.GeoDataFrame(
+            {"name": ["circle"]}, geometry=[Polygon(coords)], crs="EPSG:32635"
+        ).to_crs(4326)
+
+        tolerances = [10, 50, 200]
+        results = simplify_many(gdf, tolerances)
+        assert len(results) == 3
+        for tol, result in zip(tolerances, results):
+            expected = simplify(gdf, tolerance_m=tol)
+            assert result.crs == gdf.crs
+            assert result["name"].tolist() == ["circle"]
+            assert result.geometry.iloc[0].equals(expected.geometry.iloc[0])
+        counts = [len(r.geometry.iloc[0].exterior.coords) for r in results]
+        assert counts == sorted(counts, reverse=True)
+
+
+class TestDouglasPeucker:
+    """The Douglas-Peucker kernel (run un-jitted here) must match GEOS."""
+
+    def test_matches_geos_on_lines_and_polygons(self):
+        import numpy as np
+        import shapely
+
+        from sudapy.vector._simplify import dp_simplify
+
+        rng = np.random.default_rng(0)
+        lines = [shapely.LineString(np.cumsum(rng.normal(size=(100, 2)), axis=0))]
+        angles = np.sort(rng.uniform(0, 2 * np.pi, 100))
+        ring = np.c_[np.cos(angles), np.sin(angles)] * rng.uniform(0.8, 1.2, (100, 1))
+        polygons = [
+            Polygon(ring * 50, [ring[::-1] * 5]),
+            Polygon(ring * 50, [ring[::-1] * 0.01]),  # the hole collapses
+        ]
+        geoms = np.array([*lines, *polygons, shapely.Point(0, 0), None], dtype=object)
+
+        for tol in (0.5, 3.0):
+            expected = shapely.simplify(geoms, tol, preserve_topology=False)
+            result = dp_simplify(geoms, tol)
+            assert shapely.equals(result[:3], expected[:3]).all()
+            assert shapely.get_num_interior_rings(result[2]) == 0
+            assert result[3].equals(geoms[3])
+            assert result[4] is None
+
+    def test_max_vertices_caps_each_part(self):
+        import numpy as np
+        import shapely
+
+        from sudapy.vector._simplify import dp_simplify
+
+        rng = np.random.default_rng(1)
+        lines = np.array(
+            [shapely.LineString(np.cumsum(rng.normal(size=(200, 2)), axis=0)) for _ in range(5)]
+        )
+        uncapped = dp_simplify(lines, 0.5)
+        assert shapely.equals(dp_simplify(lines, 0.5, max_vertices=10_000), uncapped).all()
+
+        capped = dp_simplify(lines, 0.5, max_vertices=12)
+        assert (shapely.get_num_coordinates(capped) == 12).all()
+        # The most significant vertices come first: capping at the uncapped
+        # size of a coarser pass reproduces that pass.
+        coarse = dp_simplify(lines[:1], 5.0)
+        n = int(shapely.get_num_coordinates(coarse)[0])
+        assert shapely.equals(dp_simplify(lines[:1], 0.5, max_vertices=n), coarse).all()
+
+    def test_max_vertices_needs_dp_backend(self):
+        from sudapy.core.errors import SudaPyError
+
+        with pytest.raises(SudaPyError, match="backend"):
+            simplify(_make_gdf(), tolerance_m=10, max_vertices=50)
+
+    def test_unknown_backend_raises(self):
+        from sudapy.core.errors import SudaPyError
+
+        with pytest.raises(SudaPyError, match="backend"):
+            simplify(_make_gdf(), tolerance_m=10, backend="rdp")
+
+    def test_numba_backend_needs_fast_extra(self, monkeypatch):
+        import sys
+
+        from sudapy.core.errors import DependencyError
+
+        monkeypatch.setitem(sys.modules, "numba", None)
+        with pytest.raises(DependencyError, match="fast"):
+            simplify(_make_gdf(), tolerance_m=10, backend="numba")
+
 
 class TestFixGeometry:
     def test_fixes_bowtie(self):
@@ -120,9 +312,122 @@ class TestFixGeometry:
         result = fix_geometry(gdf)
         assert result.geometry.is_valid.all()
 
+    def test_null_geometry_kept_and_others_fixed(self):
+        bowtie = Polygon([(0, 0), (1, 1), (1, 0), (0, 1), (0, 0)])
+        valid = box(0, 0, 1, 1)
+        gdf = gpd.GeoDataFrame(
+            {"name": ["bad", "none", "ok"]}, geometry=[bowtie, None, valid], crs="EPSG:32635"
+        )
+        result = fix_geometry(gdf)
+        assert result.geometry.iloc[0].is_valid
+        assert result.geometry.iloc[1] is None
+        assert result.geometry.iloc[2].equals(valid)
+        assert not gdf.geometry.iloc[0].is_valid  # input left untouched
+
+    def test_result_keeps_index_columns_and_crs(self):
+        bowtie = Polygon([(0, 0), (1, 1), (1, 0), (0, 1), (0, 0)])
+        gdf = gpd.GeoDataFrame(
+            {"name": ["bad", "ok"], "code": [1, 2]},
+            geometry=[bowtie, box(0, 0, 1, 1)],
+            crs="EPSG:32635",
+            index=[10, 20],
+        )
+        result = fix_geometry(gdf)
+        assert result is not gdf
+        assert result.columns.tolist() == gdf.columns.tolist()
+        assert result.index.tolist() == [10, 20]
+        assert result.crs == gdf.crs
+        assert fix_geometry(result) is not result  # already-valid input is copied too
+
     def test_valid_geometry_unchanged(self):
         gdf = _make_gdf(32635)
         assert gdf.geometry.is_valid.all()
         result = fix_geometry(gdf)
         assert result.geometry.is_valid.all()
         assert len(result) == len(gdf)
+
+
+class TestParquet:
+    def test_roundtrip(self, tmp_path):
+        pytest.importorskip("pyarrow", reason="pyarrow not installed (needs sudapy[parquet])")
+        from sudapy.vector.ops import _read, _write
+
+        out = _write(_make_gdf(32635), tmp_path / "parcels.parquet")
+        result = _read(out)
+        assert result.crs.to_epsg() == 32635
+        assert result["name"].tolist() == ["test"]
+
+    def test_missing_pyarrow_names_the_extra(self, tmp_path, monkeypatch):
+        import sys
+
+        from sudapy.core.errors import DependencyError
+        from sudapy.vector.ops import _write
+
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        with pytest.raises(DependencyError) as exc:
+            _write(_make_gdf(32635), tmp_path / "parcels.parquet")
+        assert exc.value.hint == 'pip install "sudapy[parquet]"'
+
+
+class TestColumns:
+    @pytest.fixture
+    def wide(self):
+        gdf = _make_gdf(32635)
+        gdf["state"] = ["Khartoum"]
+        gdf["pop"] = [10]
+        return gdf
+
+    @pytest.mark.parametrize("suffix", [".gpkg", ".parquet"])
+    def test_read_only_requested_columns(self, wide, tmp_path, suffix):
+        if suffix == ".parquet":
+            pytest.importorskip("pyarrow", reason="pyarrow not installed (needs sudapy[parquet])")
+        from sudapy.vector.ops import _read, _write
+
+        path = _write(wide, tmp_path / f"wide{suffix}")
+        result = _read(path, columns=["pop"])
+        assert result.columns.tolist() == ["pop", "geometry"]
+        assert result.geometry.iloc[0].equals(wide.geometry.iloc[0])
+
+    def test_ops_pass_columns_through(self, wide, tmp_path):
+        path = tmp_path / "wide.gpkg"
+        wide.to_file(path)
+        assert buffer(path, 10, columns=["name"]).columns.tolist() == ["name", "geometry"]
+        # dissolve always reads its `by` column.
+        result = dissolve(path, by="state", columns=["pop"])
+        assert result.columns.tolist() == ["state", "geometry", "pop"]
+
+
+class TestPartitions:
+    """Row-wise partitioning must not change any result."""
+
+    def _grid(self, epsg: int = 32635) -> gpd.GeoDataFrame:
+        boxes = [box(500_000 + 150 * i, 1_700_000, 500_100 + 150 * i, 1_700_100) for i in range(7)]
+        return gpd.GeoDataFrame({"i": range(7)}, geometry=boxes, crs=f"EPSG:{epsg}")
+
+    def test_buffer_and_simplify(self):
+        gdf = self._grid()
+        for op, arg in ((buffer, 25.0), (simplify, 5.0)):
+            expected = op(gdf, arg)
+            result = op(gdf, arg, n_partitions=3)
+            assert result.geometry.geom_equals(expected.geometry).all()
+            assert result.index.equals(gdf.index)
+
+    def test_area(self):
+        gdf = self._grid()
+        result = calculate_area(gdf, n_partitions=4)
+        assert result["area_m2"].tolist() == pytest.approx([10_000.0] * 7)
+
+    def test_projected_result_keeps_columns_and_input(self):
+        gdf = self._grid().rename_geometry("geom")
+        gdf["label"] = "x"
+        before = gdf.geometry.copy()
+        result = buffer(gdf, 25.0)
+        assert list(result.columns) == ["i", "geom", "label"]
+        assert result.geometry.name == "geom" and result.crs == gdf.crs
+        result.loc[0, "i"] = 99
+        assert gdf["i"].iloc[0] == 0
+        assert gdf.geometry.geom_equals(before).all()
+
+    def test_more_partitions_than_rows(self):
+        result = buffer(_make_gdf(32635), 10.0, n_partitions=8)
+        assert len(result) == 1
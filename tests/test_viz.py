@@ -0,0 +1,63 @@
+"""Tests for map helpers that don't need matplotlib or folium."""
+
+from __future__ import annotations
+
+import pytest
+
+gpd = pytest.importorskip("geopandas", reason="geopandas not installed (needs sudapy[geo])")
+import shapely  # noqa: E402
+from shapely.geometry import Point, box  # noqa: E402
+
+from sudapy.viz.maps import _decimate, _feature_collection  # noqa: E402
+
+
+class TestDecimate:
+    def test_dense_polygon_stays_within_tolerance(self):
+        circle = Point(500_000, 1_700_000).buffer(1_000, quad_segs=256)
+        gdf = gpd.GeoDataFrame({"name": ["c"]}, geometry=[circle], crs=32636)
+        # 2 km extent drawn 100 px wide: a tenth of a pixel is 2 m.
+        out = _decimate(gdf, 100)
+        geom = out.geometry.iloc[0]
+        assert shapely.get_num_coordinates(geom) < shapely.get_num_coordinates(circle)
+        assert shapely.hausdorff_distance(geom, circle) <= 2.0
+
+    def test_preserves_crs_and_attributes(self):
+        gdf = gpd.GeoDataFrame(
+            {"name": ["a", "b"], "value": [1, 2]},
+            geometry=[box(0, 0, 1, 1), box(2, 2, 3, 3)],
+            crs=4326,
+        )
+        out = _decimate(gdf, 1_000)
+        assert out.crs == gdf.crs
+        assert list(out.columns) == list(gdf.columns)
+        assert out["name"].tolist() == ["a", "b"]
+        assert out["value"].tolist() == [1, 2]
+
+    def test_single_point_unchanged(self):
+        gdf = gpd.GeoDataFrame(geometry=[Point(32.5, 15.6)], crs=4326)
+        assert _decimate(gdf, 1_000) is gdf
+
+    def test_empty_layer_unchanged(self):
+        gdf = gpd.GeoDataFrame(geometry=[], crs=4326)
+        assert _decimate(gdf, 1_000) is gdf
+
+    def test_points_keep_their_coordinates(self):
+        gdf = gpd.GeoDataFrame(geometry=[Point(0, 0), Point(1, 1)], crs=4326)
+        out = _decimate(gdf, 1_000)
+        assert out.geometry.geom_equals(gdf.geometry).all()
+
+
+class TestFeatureCollection:
+    def test_lean_features(self):
+        gdf = gpd.GeoDataFrame(
+            {"name": ["a", "b"]}, geometry=[box(0, 0, 1, 1), None], crs=4326
+        )
+        fc = _feature_collection(gdf)
+        assert fc["type"] == "FeatureCollection"
+        assert len(fc["features"]) == 2
+        first = fc["features"][0]
+        assert "id" not in first
+        assert "bbox" not in first
+        assert first["properties"] == {"name": "a"}
+        assert first["geometry"]["type"] == "Polygon"
+        assert fc["features"][1]["geometry"] is None